@@ -5,11 +5,9 @@ Caches full RouteResponse objects keyed by (prompt, classifier_mode)
 so duplicate prompts skip the real API call entirely.
 """
 
-import hashlib
 import threading
 import time
 import traceback
-from collections import OrderedDict
 from typing import Optional
 
 from backend.app.models import ClassifierMode, RouteResponse
@@ -31,7 +29,11 @@ class _CacheEntry:
 
     __slots__ = ("value", "created_at")
 
-    def __init__(self, value: RouteResponse) -> None:
+    def __init__(self, value: Optional[RouteResponse]) -> None:
+        self.reset(value)
+
+    def reset(self, value: Optional[RouteResponse]) -> None:
+        """(Re)initialise the entry so pooled instances can be reused."""
         self.value = value
         self.created_at = time.monotonic()
 
@@ -53,7 +55,8 @@ class ResponseCache:
 
     - Max size:  evicts least-recently-used entry when full.
     - TTL:       entries older than `ttl_seconds` are treated as misses
-                 and lazily removed.
+                 and lazily removed; a background sweeper also purges
+                 them every `ttl_seconds / 4` so cold keys free their slot.
     """
 
     def __init__(
@@ -64,10 +67,20 @@ class ResponseCache:
         try:
             self._max_size = max_size
             self._ttl = ttl_seconds
-            self._store: OrderedDict[str, _CacheEntry] = OrderedDict()
+            self._store: dict[tuple[str, str], _CacheEntry] = {}
+            # Free-list of evicted entries, recycled by put()
+            self._free: list[_CacheEntry] = []
+            self._max_free = max(1, max_size // 4)
             self._lock = threading.Lock()
             self._hits = 0
             self._misses = 0
+
+            # Proactive TTL sweeper
+            self._stop_event = threading.Event()
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, name="response-cache-sweeper", daemon=True,
+            )
+            self._sweeper.start()
         except Exception:
             traceback.print_exc()
             raise
@@ -77,11 +90,15 @@ class ResponseCache:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _make_key(prompt: str, classifier_mode: ClassifierMode) -> str:
-        """Create a deterministic cache key from prompt + classifier mode."""
+    def _make_key(prompt: str, classifier_mode: ClassifierMode) -> tuple[str, str]:
+        """
+        Create a deterministic cache key from prompt + classifier mode.
+
+        The key is only ever used as a dict key, so a plain tuple is enough —
+        no need to pay for a cryptographic digest on every lookup.
+        """
         try:
-            raw = f"{prompt.strip().lower()}::{classifier_mode.value}"
-            return hashlib.sha256(raw.encode()).hexdigest()
+            return (prompt.strip().lower(), classifier_mode.value)
         except Exception:
             traceback.print_exc()
             raise
@@ -100,24 +117,37 @@ class ResponseCache:
 
         Returns the RouteResponse on hit, or None on miss / expiry.
         On hit the entry is moved to the end (most-recently-used).
+
+        The initial lookup is lock-free (dict reads are atomic under the GIL),
+        so misses never touch the lock. Hits re-check the entry under the lock
+        before reading it, since evicted entries are recycled by put().
+        Hit/miss counters are updated without the lock and are best-effort.
         """
         try:
             key = self._make_key(prompt, classifier_mode)
+            if self._store.get(key) is None:
+                self._misses += 1
+                return None
+
             with self._lock:
                 entry = self._store.get(key)
                 if entry is None:
-                    self._misses += 1
-                    return None
-
-                if entry.is_expired(self._ttl):
+                    value = None
+                elif entry.is_expired(self._ttl):
                     del self._store[key]
-                    self._misses += 1
-                    return None
+                    self._release(entry)
+                    value = None
+                else:
+                    # Move to end → most recently used (plain dicts keep
+                    # insertion order, so pop + re-insert is O(1))
+                    self._store[key] = self._store.pop(key)
+                    value = entry.value
 
-                # Move to end → most recently used
-                self._store.move_to_end(key)
+            if value is None:
+                self._misses += 1
+            else:
                 self._hits += 1
-                return entry.value
+            return value
         except Exception:
             traceback.print_exc()
             raise
@@ -138,14 +168,20 @@ class ResponseCache:
             key = self._make_key(prompt, classifier_mode)
             with self._lock:
                 # If key already exists, remove it so we can re-insert at end
-                if key in self._store:
-                    del self._store[key]
+                old = self._store.pop(key, None)
+                if old is not None:
+                    self._release(old)
 
-                # Evict LRU if at capacity
+                # Evict LRU (first inserted) if at capacity
                 while len(self._store) >= self._max_size:
-                    self._store.popitem(last=False)
+                    self._release(self._store.pop(next(iter(self._store))))
 
-                self._store[key] = _CacheEntry(response)
+                if self._free:
+                    entry = self._free.pop()
+                    entry.reset(response)
+                else:
+                    entry = _CacheEntry(response)
+                self._store[key] = entry
         except Exception:
             traceback.print_exc()
             raise
@@ -155,6 +191,7 @@ class ResponseCache:
         try:
             with self._lock:
                 self._store.clear()
+                self._free.clear()
                 self._hits = 0
                 self._misses = 0
         except Exception:
@@ -162,19 +199,74 @@ class ResponseCache:
             raise
 
     def stats(self) -> dict:
-        """Return cache statistics."""
+        """
+        Return cache statistics.
+
+        Best-effort snapshot: the counters and size are read without the
+        lock, so a metrics poll never stalls request threads.
+        """
+        try:
+            hits = self._hits
+            misses = self._misses
+            size = len(self._store)
+            total = hits + misses
+            hit_rate = (hits / total * 100) if total > 0 else 0.0
+            return {
+                "size": size,
+                "max_size": self._max_size,
+                "ttl_seconds": self._ttl,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate_percent": round(hit_rate, 2),
+            }
+        except Exception:
+            traceback.print_exc()
+            raise
+
+    def close(self) -> None:
+        """Stop the background TTL sweeper."""
+        try:
+            self._stop_event.set()
+            self._sweeper.join(timeout=5)
+        except Exception:
+            traceback.print_exc()
+            raise
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _sweep_loop(self) -> None:
+        """Periodically evict expired entries until close() is called."""
+        interval = max(self._ttl / 4, 1.0)
+        while not self._stop_event.wait(interval):
+            try:
+                self._sweep_expired()
+            except Exception:
+                # Keep the sweeper alive; lazy expiry in get() still applies
+                traceback.print_exc()
+
+    def _sweep_expired(self) -> int:
+        """Remove all expired entries. Returns how many were evicted."""
         try:
             with self._lock:
-                total = self._hits + self._misses
-                hit_rate = (self._hits / total * 100) if total > 0 else 0.0
-                return {
-                    "size": len(self._store),
-                    "max_size": self._max_size,
-                    "ttl_seconds": self._ttl,
-                    "hits": self._hits,
-                    "misses": self._misses,
-                    "hit_rate_percent": round(hit_rate, 2),
-                }
+                expired = [
+                    key for key, entry in self._store.items()
+                    if entry.is_expired(self._ttl)
+                ]
+                for key in expired:
+                    self._release(self._store.pop(key))
+                return len(expired)
+        except Exception:
+            traceback.print_exc()
+            raise
+
+    def _release(self, entry: _CacheEntry) -> None:
+        """Return an evicted entry to the free-list. Caller must hold the lock."""
+        try:
+            if len(self._free) < self._max_free:
+                entry.value = None
+                self._free.append(entry)
         except Exception:
             traceback.print_exc()
             raise
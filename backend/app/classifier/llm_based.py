@@ -28,11 +28,28 @@ load_dotenv(_ENV_PATH)
 
 _CLASSIFIER_PROVIDER = os.getenv("CLASSIFIER_LLM_PROVIDER", "anthropic").lower()
 
+# ---------------------------------------------------------------------------
+# JSON decoder — orjson if available, stdlib json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except
+# clause covers both.
+# ---------------------------------------------------------------------------
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # ---------------------------------------------------------------------------
 # Valid task types (for the prompt sent to the LLM)
 # ---------------------------------------------------------------------------
 
 _VALID_TASK_TYPES = [t.value for t in TaskType]
+_VALID_TASK_TYPES_SET = frozenset(_VALID_TASK_TYPES)
+
+# Value → member map, avoids the Enum lookup machinery of TaskType(value)
+_TASK_TYPE_BY_VALUE: dict[str, TaskType] = {t.value: t for t in TaskType}
 
 # ---------------------------------------------------------------------------
 # System prompt shared by both providers
@@ -68,23 +85,63 @@ IMPORTANT: Return ONLY the raw JSON object, no markdown fences, no extra text.""
 
 
 # ---------------------------------------------------------------------------
-# Provider: Anthropic (Claude)
+# Shared async clients — created lazily on first use and reused so every
+# classification rides the SDK's pooled HTTP connections instead of paying
+# for a fresh TLS handshake.
 # ---------------------------------------------------------------------------
 
-def _classify_with_anthropic(prompt: str) -> dict:
-    """Call Claude Haiku to classify the prompt. Returns parsed JSON dict."""
+_anthropic_client = None
+_openai_client = None
+
+
+def _get_anthropic_client():
+    """Return the shared AsyncAnthropic client, creating it on first use."""
+    global _anthropic_client
     try:
-        import anthropic
+        if _anthropic_client is None:
+            import anthropic
+
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+            if not api_key:
+                raise ValueError(
+                    "ANTHROPIC_API_KEY not set. Add it to your .env file."
+                )
+            _anthropic_client = anthropic.AsyncAnthropic(api_key=api_key)
+        return _anthropic_client
+    except Exception:
+        traceback.print_exc()
+        raise
 
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "ANTHROPIC_API_KEY not set. Add it to your .env file."
-            )
 
-        client = anthropic.Anthropic(api_key=api_key)
+def _get_openai_client():
+    """Return the shared AsyncOpenAI client, creating it on first use."""
+    global _openai_client
+    try:
+        if _openai_client is None:
+            from openai import AsyncOpenAI
+
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError(
+                    "OPENAI_API_KEY not set. Add it to your .env file."
+                )
+            _openai_client = AsyncOpenAI(api_key=api_key)
+        return _openai_client
+    except Exception:
+        traceback.print_exc()
+        raise
+
 
-        message = client.messages.create(
+# ---------------------------------------------------------------------------
+# Provider: Anthropic (Claude)
+# ---------------------------------------------------------------------------
+
+async def _classify_with_anthropic(prompt: str) -> dict:
+    """Call Claude Haiku to classify the prompt. Returns parsed JSON dict."""
+    try:
+        client = _get_anthropic_client()
+
+        message = await client.messages.create(
             model="claude-haiku-4-5-20251001",
             max_tokens=300,
             system=_SYSTEM_PROMPT,
@@ -104,20 +161,12 @@ def _classify_with_anthropic(prompt: str) -> dict:
 # Provider: OpenAI (GPT-4o-mini)
 # ---------------------------------------------------------------------------
 
-def _classify_with_openai(prompt: str) -> dict:
+async def _classify_with_openai(prompt: str) -> dict:
     """Call GPT-4o-mini to classify the prompt. Returns parsed JSON dict."""
     try:
-        from openai import OpenAI
-
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "OPENAI_API_KEY not set. Add it to your .env file."
-            )
-
-        client = OpenAI(api_key=api_key)
+        client = _get_openai_client()
 
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             max_tokens=300,
             temperature=0.3,
@@ -147,12 +196,14 @@ def _parse_llm_response(raw_text: str) -> dict:
         # Strip markdown code fences if present
         cleaned = raw_text.strip()
         if cleaned.startswith("```"):
-            lines = cleaned.split("\n")
-            # Remove first line (```json) and last line (```)
-            lines = [l for l in lines if not l.strip().startswith("```")]
-            cleaned = "\n".join(lines).strip()
+            # Slice off the opening fence line (```json) and closing ```
+            newline = cleaned.find("\n")
+            cleaned = cleaned[newline + 1:] if newline != -1 else ""
+            if cleaned.endswith("```"):
+                cleaned = cleaned[:-3]
+            cleaned = cleaned.strip()
 
-        data = json.loads(cleaned)
+        data = _json_loads(cleaned)
 
         # Validate and clamp complexity_score
         score = int(data.get("complexity_score", 5))
@@ -160,7 +211,7 @@ def _parse_llm_response(raw_text: str) -> dict:
 
         # Validate task_type
         raw_type = str(data.get("task_type", "general")).lower().strip()
-        if raw_type not in _VALID_TASK_TYPES:
+        if raw_type not in _VALID_TASK_TYPES_SET:
             raw_type = "general"
 
         # Validate confidence
@@ -192,7 +243,7 @@ def _parse_llm_response(raw_text: str) -> dict:
 # Public API
 # ---------------------------------------------------------------------------
 
-def classify(prompt: str) -> ClassificationResult:
+async def classify(prompt: str) -> ClassificationResult:
     """
     Classify a prompt by sending it to a real LLM (Claude Haiku or GPT-4o-mini).
 
@@ -201,13 +252,13 @@ def classify(prompt: str) -> ClassificationResult:
     """
     try:
         if _CLASSIFIER_PROVIDER == "openai":
-            data = _classify_with_openai(prompt)
+            data = await _classify_with_openai(prompt)
         else:
-            data = _classify_with_anthropic(prompt)
+            data = await _classify_with_anthropic(prompt)
 
         return ClassificationResult(
             complexity_score=data["complexity_score"],
-            task_type=TaskType(data["task_type"]),
+            task_type=_TASK_TYPE_BY_VALUE.get(data["task_type"], TaskType.GENERAL),
             reasoning=data["reasoning"],
             confidence=data["confidence"],
             classifier_mode=ClassifierMode.LLM_BASED,
@@ -7,7 +7,10 @@ aggregated GatewayStats on demand.
 
 import threading
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterator, Optional
 
 from backend.app.models import (
     CostComparison,
@@ -17,19 +20,103 @@ from backend.app.models import (
     ModelUsageStat,
     RouteResponse,
 )
-from backend.app.router import get_baseline_model
+from backend.app.router import BASELINE_RATIO
 
+# ---------------------------------------------------------------------------
+# Defaults
+# ---------------------------------------------------------------------------
 
-class RequestLogger:
-    """Thread-safe in-memory store for routing log entries and statistics."""
+_DEFAULT_MAX_ENTRIES = 10_000   # oldest log entries are dropped beyond this
+
+
+# ---------------------------------------------------------------------------
+# Reader-writer lock
+# ---------------------------------------------------------------------------
+
+class _RWLock:
+    """
+    Minimal writer-preferring reader-writer lock.
+
+    Any number of readers may hold the lock at once; a writer gets
+    exclusive access. Waiting writers block new readers so a steady
+    stream of reads cannot starve log().
+    """
 
     def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
         try:
-            self._entries: list[LogEntry] = []
-            self._lock = threading.Lock()
-        except Exception:
-            traceback.print_exc()
-            raise
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+# ---------------------------------------------------------------------------
+# RequestLogger
+# ---------------------------------------------------------------------------
+
+class RequestLogger:
+    """
+    Thread-safe in-memory store for routing log entries and statistics.
+
+    Reads (/logs, /stats, count) share a reader lock; log() and clear()
+    take the writer lock. Only the newest `max_entries` entries are kept for
+    /logs; stats aggregates are maintained incrementally in log() and cover
+    every request ever logged.
+
+    log_async() only enqueues the response; a background writer thread
+    applies queued responses in batches. Readers flush anything still
+    queued first, so a request is always visible once its response has
+    been returned.
+    """
+
+    def __init__(self, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        self._entries: deque[LogEntry] = deque(maxlen=max_entries)
+        self._lock = _RWLock()
+        self._reset_aggregates()
+
+        # Built GatewayStats, stamped with the _version it was built at.
+        # log()/clear() bump _version, which invalidates the cache.
+        self._version = 0
+        self._stats_cache: Optional[tuple[int, GatewayStats]] = None
+
+        # Responses queued by log_async(), drained by the writer thread
+        self._pending: deque[RouteResponse] = deque()
+        self._pending_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="request-logger-writer", daemon=True,
+        )
+        self._writer.start()
 
     # ------------------------------------------------------------------
     # Write
@@ -40,14 +127,17 @@ class RequestLogger:
         Record a completed route response.
         Returns the created LogEntry.
         """
-        try:
-            entry = LogEntry.from_route_response(response)
-            with self._lock:
-                self._entries.append(entry)
-            return entry
-        except Exception:
-            traceback.print_exc()
-            raise
+        with self._lock.write():
+            self._drain_pending()
+            return self._append(response)
+
+    def log_async(self, response: RouteResponse) -> None:
+        """
+        Queue a completed route response for the background writer.
+        Never blocks on the logger lock.
+        """
+        self._pending.append(response)
+        self._pending_event.set()
 
     # ------------------------------------------------------------------
     # Read
@@ -58,150 +148,191 @@ class RequestLogger:
         Return log entries in reverse-chronological order (newest first).
         Supports pagination via limit/offset.
         """
-        try:
-            with self._lock:
-                reversed_entries = list(reversed(self._entries))
-                return reversed_entries[offset : offset + limit]
-        except Exception:
-            traceback.print_exc()
-            raise
+        self._flush_pending()
+        with self._lock.read():
+            if limit <= 0 or offset >= len(self._entries):
+                return []
+            # Walk from the newest end; only offset + limit items are visited
+            return list(islice(reversed(self._entries), offset, offset + limit))
 
     def get_stats(self) -> GatewayStats:
-        """Compute aggregated gateway statistics from all logged entries."""
-        try:
-            with self._lock:
-                entries = list(self._entries)
-
-            if not entries:
-                return GatewayStats(
-                    total_requests=0,
-                    total_cost=0.0,
-                    total_baseline_cost=0.0,
-                    total_savings=0.0,
-                    savings_percent=0.0,
-                    model_usage=[],
-                    avg_complexity=0.0,
-                )
-
-            baseline_model_info = get_baseline_model()
-            baseline_avg_cost_per_1k = (
-                baseline_model_info.cost_per_1k_input_tokens
-                + baseline_model_info.cost_per_1k_output_tokens
-            ) / 2
-
-            total_cost = 0.0
-            total_baseline_cost = 0.0
-            total_complexity = 0
-
-            # Per-model accumulators
-            model_counts: dict[ModelName, int] = defaultdict(int)
-            model_costs: dict[ModelName, float] = defaultdict(float)
-            model_latencies: dict[ModelName, list[int]] = defaultdict(list)
-
-            for entry in entries:
-                total_cost += entry.cost
-                total_complexity += entry.complexity_score
-
-                # Estimate baseline cost: use the same token count but at
-                # baseline model pricing. We approximate tokens from the
-                # actual cost and the routed model's pricing.
-                # Simpler approach: assume same tokens → scale by price ratio.
-                total_baseline_cost += self._estimate_baseline_cost(
-                    entry, baseline_avg_cost_per_1k,
-                )
-
-                model_counts[entry.routed_model] += 1
-                model_costs[entry.routed_model] += entry.cost
-                model_latencies[entry.routed_model].append(entry.latency_ms)
-
-            total_requests = len(entries)
-            total_savings = max(0.0, total_baseline_cost - total_cost)
-            savings_percent = (
-                (total_savings / total_baseline_cost * 100)
-                if total_baseline_cost > 0
-                else 0.0
-            )
-            # Clamp to 100 to satisfy the validator
-            savings_percent = min(savings_percent, 100.0)
+        """
+        Build aggregated gateway statistics from the running totals.
 
-            avg_complexity = total_complexity / total_requests
+        The result is cached until the next log()/clear(), so repeated
+        dashboard polls between writes reuse the same object.
+        """
+        self._flush_pending()
+        with self._lock.read():
+            cached = self._stats_cache
+            if cached is not None and cached[0] == self._version:
+                return cached[1]
 
-            model_usage = []
-            for model in model_counts:
-                latencies = model_latencies[model]
-                model_usage.append(ModelUsageStat(
-                    model=model,
-                    request_count=model_counts[model],
-                    total_cost=round(model_costs[model], 6),
-                    avg_latency_ms=round(sum(latencies) / len(latencies), 2),
-                ))
+            version = self._version
+            total_requests = self._total_requests
+            total_cost = self._total_cost
+            total_baseline_cost = self._total_baseline_cost
+            total_complexity = self._total_complexity
+            model_counts = dict(self._model_counts)
+            model_costs = dict(self._model_costs)
+            model_latency_sums = dict(self._model_latency_sums)
 
-            return GatewayStats(
-                total_requests=total_requests,
-                total_cost=round(total_cost, 6),
-                total_baseline_cost=round(total_baseline_cost, 6),
-                total_savings=round(total_savings, 6),
-                savings_percent=round(savings_percent, 2),
-                model_usage=model_usage,
-                avg_complexity=round(avg_complexity, 2),
-            )
-        except Exception:
-            traceback.print_exc()
-            raise
+        stats = self._build_stats(
+            total_requests, total_cost, total_baseline_cost, total_complexity,
+            model_counts, model_costs, model_latency_sums,
+        )
+        # Plain attribute store; a stale build is simply ignored by the
+        # version check above.
+        self._stats_cache = (version, stats)
+        return stats
+
+    def close(self) -> None:
+        """Stop the background writer after applying anything still queued."""
+        self._stop_event.set()
+        self._pending_event.set()
+        self._writer.join(timeout=5)
+        self._flush_pending()
 
     # ------------------------------------------------------------------
-    # Helpers
+    # Background writer
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _estimate_baseline_cost(
-        entry: LogEntry,
-        baseline_avg_cost_per_1k: float,
-    ) -> float:
+    def _writer_loop(self) -> None:
+        """Apply queued responses in batches until close() is called."""
+        while not self._stop_event.is_set():
+            self._pending_event.wait()
+            self._pending_event.clear()
+            try:
+                self._flush_pending()
+            except Exception:
+                # Keep the writer alive whatever goes wrong
+                traceback.print_exc()
+
+    def _flush_pending(self) -> None:
+        """Apply every queued response under a single write-lock hold."""
+        if not self._pending:
+            return
+        with self._lock.write():
+            self._drain_pending()
+
+    def _drain_pending(self) -> None:
         """
-        Estimate what a request would have cost using the baseline model.
-        Uses a simple ratio: if we know the actual cost and the model's
-        avg rate, we can derive approximate tokens and re-price at baseline.
+        Append all queued responses. Caller must hold the write lock.
+
+        A response that fails to append is reported and skipped; it never
+        costs the rest of the queue or reaches the caller that flushed.
         """
-        try:
-            from backend.app.router import MODEL_REGISTRY
+        pending = self._pending
+        while pending:
+            response = pending.popleft()
+            try:
+                self._append(response)
+            except Exception:
+                traceback.print_exc()
+
+    def _append(self, response: RouteResponse) -> LogEntry:
+        """Record one response. Caller must hold the write lock."""
+        entry = LogEntry.from_route_response(response)
+        self._entries.append(entry)
+
+        self._total_requests += 1
+        self._total_cost += entry.cost
+        self._total_baseline_cost += self._estimate_baseline_cost(entry)
+        self._total_complexity += entry.complexity_score
+        self._model_counts[entry.routed_model] += 1
+        self._model_costs[entry.routed_model] += entry.cost
+        self._model_latency_sums[entry.routed_model] += entry.latency_ms
+        self._version += 1
+        return entry
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
 
-            model_info = MODEL_REGISTRY.get(entry.routed_model)
-            if model_info is None:
-                return entry.cost
+    @staticmethod
+    def _build_stats(
+        total_requests: int,
+        total_cost: float,
+        total_baseline_cost: float,
+        total_complexity: int,
+        model_counts: dict[ModelName, int],
+        model_costs: dict[ModelName, float],
+        model_latency_sums: dict[ModelName, int],
+    ) -> GatewayStats:
+        """Assemble a GatewayStats from a snapshot of the running totals."""
+        if total_requests == 0:
+            return GatewayStats(
+                total_requests=0,
+                total_cost=0.0,
+                total_baseline_cost=0.0,
+                total_savings=0.0,
+                savings_percent=0.0,
+                model_usage=[],
+                avg_complexity=0.0,
+            )
 
-            model_avg_cost_per_1k = (
-                model_info.cost_per_1k_input_tokens
-                + model_info.cost_per_1k_output_tokens
-            ) / 2
+        total_savings = max(0.0, total_baseline_cost - total_cost)
+        savings_percent = (
+            (total_savings / total_baseline_cost * 100)
+            if total_baseline_cost > 0
+            else 0.0
+        )
+        # Clamp to 100 to satisfy the validator
+        savings_percent = min(savings_percent, 100.0)
 
-            if model_avg_cost_per_1k <= 0:
-                return entry.cost
+        avg_complexity = total_complexity / total_requests
 
-            # Approximate token count from actual cost
-            approx_tokens = (entry.cost / model_avg_cost_per_1k) * 1000
-            baseline_cost = (approx_tokens / 1000) * baseline_avg_cost_per_1k
+        model_usage = []
+        for model, count in model_counts.items():
+            model_usage.append(ModelUsageStat(
+                model=model,
+                request_count=count,
+                total_cost=round(model_costs[model], 6),
+                avg_latency_ms=round(model_latency_sums[model] / count, 2),
+            ))
 
-            return round(baseline_cost, 6)
-        except Exception:
-            traceback.print_exc()
-            raise
+        return GatewayStats(
+            total_requests=total_requests,
+            total_cost=round(total_cost, 6),
+            total_baseline_cost=round(total_baseline_cost, 6),
+            total_savings=round(total_savings, 6),
+            savings_percent=round(savings_percent, 2),
+            model_usage=model_usage,
+            avg_complexity=round(avg_complexity, 2),
+        )
+
+    @staticmethod
+    def _estimate_baseline_cost(entry: LogEntry) -> float:
+        """
+        Estimate what a request would have cost using the baseline model.
+        Assumes the same token count and re-prices it at baseline rates,
+        which is just the actual cost scaled by the precomputed price ratio.
+        """
+        ratio = BASELINE_RATIO.get(entry.routed_model, 1.0)
+        return round(entry.cost * ratio, 6)
 
     def clear(self) -> None:
-        """Remove all log entries."""
-        try:
-            with self._lock:
-                self._entries.clear()
-        except Exception:
-            traceback.print_exc()
-            raise
+        """Remove all log entries (queued ones too) and reset the stats aggregates."""
+        with self._lock.write():
+            self._pending.clear()
+            self._entries.clear()
+            self._reset_aggregates()
+            self._version += 1
+
+    def _reset_aggregates(self) -> None:
+        """Zero the running stats totals. Caller must hold the write lock."""
+        self._total_requests = 0
+        self._total_cost = 0.0
+        self._total_baseline_cost = 0.0
+        self._total_complexity = 0
+        # Per-model accumulators (insertion order = first-seen order)
+        self._model_counts: dict[ModelName, int] = defaultdict(int)
+        self._model_costs: dict[ModelName, float] = defaultdict(float)
+        self._model_latency_sums: dict[ModelName, int] = defaultdict(int)
 
     @property
     def count(self) -> int:
-        """Return total number of logged entries."""
-        try:
-            with self._lock:
-                return len(self._entries)
-        except Exception:
-            traceback.print_exc()
-            raise
+        """Return total number of logged requests (including evicted entries)."""
+        self._flush_pending()
+        with self._lock.read():
+            return self._total_requests
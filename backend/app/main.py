@@ -2,29 +2,37 @@
 FastAPI application — AI Gateway entry point.
 
 Endpoints:
-  POST /route   — classify + route + generate response (main endpoint)
-  GET  /models  — list available models with pricing
-  GET  /logs    — get routing history
-  GET  /stats   — aggregated cost savings, model usage distribution
-  GET  /health  — simple health check
+  POST /route         — classify + route + generate response (main endpoint)
+  POST /route/stream  — same, streamed as server-sent events
+  GET  /models        — list available models with pricing
+  GET  /logs          — get routing history
+  GET  /stats         — aggregated cost savings, model usage distribution
+  GET  /health        — simple health check
 """
 
+import json
 import traceback
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 from backend.app.cache import ResponseCache
 from backend.app.logger import RequestLogger
 from backend.app.models import (
+    ClassificationResult,
     ClassifierMode,
     CostComparison,
     GatewayStats,
     LogEntry,
     ModelInfo,
     ModelName,
+    ProviderResponse,
     RouteRequest,
     RouteResponse,
+    RoutingDecision,
 )
 from backend.app.router import get_all_models, get_baseline_model, route
 from backend.app.providers.manager import ProviderManager
@@ -35,10 +43,19 @@ from backend.app.classifier import llm_based as llm_classifier
 # App init
 # ---------------------------------------------------------------------------
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """On shutdown, stop the cache sweeper and flush queued log entries."""
+    yield
+    _cache.close()
+    _logger.close()
+
+
 app = FastAPI(
     title="AI Gateway",
     description="Intelligent LLM router that selects the optimal model based on prompt complexity.",
     version="1.0.0",
+    lifespan=_lifespan,
 )
 
 app.add_middleware(
@@ -57,13 +74,78 @@ _cache = ResponseCache()
 _logger = RequestLogger()
 _provider_manager = ProviderManager()
 
+# Baseline (GPT-4o) blended price per token, fixed for the process lifetime
+_BASELINE_INFO = get_baseline_model()
+_BASELINE_COST_PER_TOKEN = (
+    _BASELINE_INFO.cost_per_1k_input_tokens
+    + _BASELINE_INFO.cost_per_1k_output_tokens
+) / 2 / 1000
+
+
+# ---------------------------------------------------------------------------
+# Route pipeline helpers (shared by /route and /route/stream)
+# ---------------------------------------------------------------------------
+
+async def _classify(request: RouteRequest) -> ClassificationResult:
+    """Classify the prompt with the requested classifier."""
+    if request.classifier_mode == ClassifierMode.LLM_BASED:
+        return await llm_classifier.classify(request.prompt)
+    return rb_classifier.classify(request.prompt)
+
+
+def _complete_route(
+    request: RouteRequest,
+    classification: ClassificationResult,
+    routing: RoutingDecision,
+    provider_response: ProviderResponse,
+) -> RouteResponse:
+    """Price against the baseline, assemble the response, cache and log it."""
+    # Cost comparison vs baseline (GPT-4o)
+    baseline_cost = provider_response.tokens_used * _BASELINE_COST_PER_TOKEN
+
+    chosen_cost = provider_response.simulated_cost
+    if baseline_cost > 0 and chosen_cost < baseline_cost:
+        savings_pct = round(((baseline_cost - chosen_cost) / baseline_cost) * 100, 2)
+    else:
+        savings_pct = 0.0
+
+    cost_comparison = CostComparison(
+        chosen_model=routing.model,
+        chosen_cost=round(chosen_cost, 6),
+        baseline_model=ModelName.GPT_4O,
+        baseline_cost=round(baseline_cost, 6),
+        savings_percent=savings_pct,
+    )
+
+    # Assemble response
+    response = RouteResponse(
+        prompt=request.prompt,
+        classification=classification,
+        routing=routing,
+        response=provider_response,
+        cost_comparison=cost_comparison,
+    )
+
+    # Cache it
+    _cache.put(request.prompt, request.classifier_mode, response)
+
+    # Log it (applied by the logger's background writer)
+    _logger.log_async(response)
+
+    return response
+
+
+def _sse(event: str, data: str) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {data}\n\n"
+
 
 # ---------------------------------------------------------------------------
 # POST /route
 # ---------------------------------------------------------------------------
 
 @app.post("/route", response_model=RouteResponse)
-def route_prompt(request: RouteRequest) -> RouteResponse:
+async def route_prompt(request: RouteRequest) -> RouteResponse:
     """
     Main endpoint: classify the prompt, route to the optimal model,
     generate a response, and return everything the UI needs.
@@ -75,56 +157,46 @@ def route_prompt(request: RouteRequest) -> RouteResponse:
             return cached
 
         # 2. Classify
-        if request.classifier_mode == ClassifierMode.LLM_BASED:
-            classification = llm_classifier.classify(request.prompt)
-        else:
-            classification = rb_classifier.classify(request.prompt)
+        classification = await _classify(request)
 
         # 3. Route
         routing = route(classification)
 
         # 4. Generate response via real provider
-        provider_response = _provider_manager.generate(request.prompt, routing.model)
-
-        # 5. Cost comparison vs baseline (GPT-4o)
-        baseline_info = get_baseline_model()
-        baseline_avg_cost = (
-            baseline_info.cost_per_1k_input_tokens
-            + baseline_info.cost_per_1k_output_tokens
-        ) / 2
-        baseline_cost = (provider_response.tokens_used / 1000) * baseline_avg_cost
-
-        chosen_cost = provider_response.simulated_cost
-        if baseline_cost > 0 and chosen_cost < baseline_cost:
-            savings_pct = round(((baseline_cost - chosen_cost) / baseline_cost) * 100, 2)
-        else:
-            savings_pct = 0.0
-
-        cost_comparison = CostComparison(
-            chosen_model=routing.model,
-            chosen_cost=round(chosen_cost, 6),
-            baseline_model=ModelName.GPT_4O,
-            baseline_cost=round(baseline_cost, 6),
-            savings_percent=savings_pct,
+        provider_response = await _provider_manager.generate(
+            request.prompt, routing.model,
         )
 
-        # 6. Assemble response
-        response = RouteResponse(
-            prompt=request.prompt,
-            classification=classification,
-            routing=routing,
-            response=provider_response,
-            cost_comparison=cost_comparison,
-        )
+        # 5. Cost comparison, assemble, cache and log
+        return _complete_route(request, classification, routing, provider_response)
 
-        # 7. Cache it
-        _cache.put(request.prompt, request.classifier_mode, response)
+    except ValueError as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
-        # 8. Log it
-        _logger.log(response)
 
-        return response
+# ---------------------------------------------------------------------------
+# POST /route/stream
+# ---------------------------------------------------------------------------
 
+@app.post("/route/stream")
+async def route_prompt_stream(request: RouteRequest) -> StreamingResponse:
+    """
+    Streaming variant of /route, as server-sent events:
+      event: delta — {"text": "..."} for each chunk of generated text
+      event: done  — the full RouteResponse (usage, cost, reasoning)
+      event: error — {"detail": "..."} if generation fails mid-stream
+    Classification and routing errors are raised before the stream starts.
+    """
+    try:
+        cached = _cache.get(request.prompt, request.classifier_mode)
+        if cached is None:
+            classification = await _classify(request)
+            routing = route(classification)
+            chunks = _provider_manager.stream(request.prompt, routing.model)
     except ValueError as e:
         traceback.print_exc()
         raise HTTPException(status_code=400, detail=str(e))
@@ -132,6 +204,28 @@ def route_prompt(request: RouteRequest) -> RouteResponse:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
+    async def events() -> AsyncIterator[str]:
+        if cached is not None:
+            yield _sse("delta", json.dumps({"text": cached.response.response_text}))
+            yield _sse("done", cached.model_dump_json())
+            return
+        try:
+            async for chunk in chunks:
+                if isinstance(chunk, ProviderResponse):
+                    response = _complete_route(request, classification, routing, chunk)
+                    yield _sse("done", response.model_dump_json())
+                else:
+                    yield _sse("delta", json.dumps({"text": chunk}))
+        except Exception as e:
+            traceback.print_exc()
+            yield _sse("error", json.dumps({"detail": f"Internal error: {str(e)}"}))
+        finally:
+            # Close the provider stream now rather than at garbage collection
+            # when the client disconnects mid-stream
+            await chunks.aclose()
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 
 # ---------------------------------------------------------------------------
 # GET /models
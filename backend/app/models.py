@@ -5,13 +5,13 @@ Covers: classification, routing, provider responses, logging, stats,
 and all API request / response envelopes.
 """
 
-import traceback
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # ---------------------------------------------------------------------------
@@ -73,13 +73,9 @@ class ClassificationResult(BaseModel):
     @field_validator("complexity_score")
     @classmethod
     def validate_complexity_range(cls, v: int) -> int:
-        try:
-            if not 1 <= v <= 10:
-                raise ValueError("complexity_score must be between 1 and 10")
-            return v
-        except Exception:
-            traceback.print_exc()
-            raise
+        if not 1 <= v <= 10:
+            raise ValueError("complexity_score must be between 1 and 10")
+        return v
 
 
 # ---------------------------------------------------------------------------
@@ -88,12 +84,18 @@ class ClassificationResult(BaseModel):
 
 class ReasoningStep(BaseModel):
     """One step inside the router's reasoning chain."""
+    # Frozen so the router can share prebuilt steps between decisions
+    model_config = ConfigDict(frozen=True)
+
     step: int
     description: str
 
 
 class RoutingDecision(BaseModel):
     """Full routing result returned by the router."""
+    # Frozen so the router can hand out cached decisions
+    model_config = ConfigDict(frozen=True)
+
     model: ModelName
     provider: ProviderName
     reasoning_chain: list[ReasoningStep] = Field(
@@ -157,14 +159,10 @@ class RouteRequest(BaseModel):
     @field_validator("prompt")
     @classmethod
     def validate_prompt_not_blank(cls, v: str) -> str:
-        try:
-            stripped = v.strip()
-            if not stripped:
-                raise ValueError("prompt must not be blank or whitespace-only")
-            return stripped
-        except Exception:
-            traceback.print_exc()
-            raise
+        stripped = v.strip()
+        if not stripped:
+            raise ValueError("prompt must not be blank or whitespace-only")
+        return stripped
 
 
 class RouteResponse(BaseModel):
@@ -197,13 +195,9 @@ class CostComparison(BaseModel):
     @field_validator("savings_percent")
     @classmethod
     def validate_savings_range(cls, v: float) -> float:
-        try:
-            if not 0.0 <= v <= 100.0:
-                raise ValueError("savings_percent must be between 0 and 100")
-            return round(v, 2)
-        except Exception:
-            traceback.print_exc()
-            raise
+        if not 0.0 <= v <= 100.0:
+            raise ValueError("savings_percent must be between 0 and 100")
+        return round(v, 2)
 
 
 # Rebuild RouteResponse now that CostComparison is defined
@@ -214,40 +208,52 @@ RouteResponse.model_rebuild()
 # Logging schemas
 # ---------------------------------------------------------------------------
 
-class LogEntry(BaseModel):
+_SNIPPET_MAX_CHARS = 120
+_SNIPPET_ELLIPSIS = "..."
+_SNIPPET_HEAD_CHARS = _SNIPPET_MAX_CHARS - len(_SNIPPET_ELLIPSIS)
+
+
+# A slotted dataclass rather than a BaseModel: entries are built only from
+# an already-validated RouteResponse and the logger keeps thousands of
+# them in memory. FastAPI still validates and serialises them against
+# these annotations at the /logs response boundary.
+@dataclass(slots=True, frozen=True)
+class LogEntry:
     """One row in the routing-history log."""
     request_id: str
     timestamp: datetime
-    prompt_snippet: str = Field(
-        ..., max_length=120,
+    prompt_snippet: Annotated[str, Field(
+        max_length=_SNIPPET_MAX_CHARS,
         description="Truncated prompt for display in tables",
-    )
+    )]
     classifier_mode: ClassifierMode
-    complexity_score: int = Field(..., ge=1, le=10)
+    complexity_score: Annotated[int, Field(ge=1, le=10)]
     task_type: TaskType
     routed_model: ModelName
-    latency_ms: int = Field(..., ge=0)
-    cost: float = Field(..., ge=0.0)
+    latency_ms: Annotated[int, Field(ge=0)]
+    cost: Annotated[float, Field(ge=0.0)]
 
     @staticmethod
     def from_route_response(resp: RouteResponse) -> "LogEntry":
         """Build a compact log entry from a full route response."""
-        try:
-            snippet = resp.prompt[:117] + "..." if len(resp.prompt) > 120 else resp.prompt
-            return LogEntry(
-                request_id=resp.request_id,
-                timestamp=resp.timestamp,
-                prompt_snippet=snippet,
-                classifier_mode=resp.classification.classifier_mode,
-                complexity_score=resp.classification.complexity_score,
-                task_type=resp.classification.task_type,
-                routed_model=resp.routing.model,
-                latency_ms=resp.response.latency_ms,
-                cost=resp.response.simulated_cost,
-            )
-        except Exception:
-            traceback.print_exc()
-            raise
+        prompt = resp.prompt
+        # Short prompts are stored as-is (no copy); long ones are cut once
+        if len(prompt) > _SNIPPET_MAX_CHARS:
+            snippet = prompt[:_SNIPPET_HEAD_CHARS] + _SNIPPET_ELLIPSIS
+        else:
+            snippet = prompt
+        classification = resp.classification
+        return LogEntry(
+            resp.request_id,
+            resp.timestamp,
+            snippet,
+            classification.classifier_mode,
+            classification.complexity_score,
+            classification.task_type,
+            resp.routing.model,
+            resp.response.latency_ms,
+            resp.response.simulated_cost,
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -281,10 +287,6 @@ class GatewayStats(BaseModel):
     @field_validator("savings_percent")
     @classmethod
     def validate_stats_savings(cls, v: float) -> float:
-        try:
-            if not 0.0 <= v <= 100.0:
-                raise ValueError("savings_percent must be between 0 and 100")
-            return round(v, 2)
-        except Exception:
-            traceback.print_exc()
-            raise
+        if not 0.0 <= v <= 100.0:
+            raise ValueError("savings_percent must be between 0 and 100")
+        return round(v, 2)
@@ -2,8 +2,8 @@
 Base provider interface for LLM providers.
 """
 
-import traceback
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Union
 
 from backend.app.models import ModelName, ProviderResponse
 
@@ -12,7 +12,7 @@ class BaseProvider(ABC):
     """Abstract base class that every LLM provider must implement."""
 
     @abstractmethod
-    def generate(self, prompt: str, model: ModelName) -> ProviderResponse:
+    async def generate(self, prompt: str, model: ModelName) -> ProviderResponse:
         """
         Send a prompt to the specified model and return the response.
 
@@ -26,6 +26,22 @@ class BaseProvider(ABC):
         """
         ...
 
+    async def stream(
+        self,
+        prompt: str,
+        model: ModelName,
+    ) -> AsyncIterator[Union[str, ProviderResponse]]:
+        """
+        Stream a generation: yield text deltas as they arrive, then the
+        final ProviderResponse (full text, usage, latency, cost) last.
+
+        The default implementation does not stream — it yields the whole
+        text as one delta. Providers with a streaming API override this.
+        """
+        response = await self.generate(prompt, model)
+        yield response.response_text
+        yield response
+
     @abstractmethod
     def supports_model(self, model: ModelName) -> bool:
         """Return True if this provider can serve the given model."""
@@ -39,10 +55,6 @@ class BaseProvider(ABC):
         cost_per_1k_output: float,
     ) -> float:
         """Compute the dollar cost for a request given token counts and rates."""
-        try:
-            input_cost = (input_tokens / 1000) * cost_per_1k_input
-            output_cost = (output_tokens / 1000) * cost_per_1k_output
-            return round(input_cost + output_cost, 6)
-        except Exception:
-            traceback.print_exc()
-            raise
+        input_cost = (input_tokens / 1000) * cost_per_1k_input
+        output_cost = (output_tokens / 1000) * cost_per_1k_output
+        return round(input_cost + output_cost, 6)
@@ -3,7 +3,7 @@ Provider manager — resolves the correct provider for a given model
 and dispatches the generation request.
 """
 
-import traceback
+from typing import AsyncIterator, Union
 
 from backend.app.models import ModelName, ProviderResponse
 from backend.app.providers.base import BaseProvider
@@ -18,28 +18,40 @@ class ProviderManager:
     """
 
     def __init__(self) -> None:
-        try:
-            self._providers: list[BaseProvider] = [
-                OpenAIProvider(),
-                AnthropicProvider(),
-            ]
-        except Exception:
-            traceback.print_exc()
-            raise
-
-    def generate(self, prompt: str, model: ModelName) -> ProviderResponse:
+        self._providers: list[BaseProvider] = [
+            OpenAIProvider(),
+            AnthropicProvider(),
+        ]
+        # Resolve each model to its provider once; first provider wins
+        self._by_model: dict[ModelName, BaseProvider] = {}
+        for provider in self._providers:
+            for model in ModelName:
+                if provider.supports_model(model):
+                    self._by_model.setdefault(model, provider)
+
+    async def generate(self, prompt: str, model: ModelName) -> ProviderResponse:
         """
         Find the provider that supports the given model and generate a response.
         """
-        try:
-            for provider in self._providers:
-                if provider.supports_model(model):
-                    return provider.generate(prompt, model)
+        return await self._resolve(model).generate(prompt, model)
+
+    def stream(
+        self,
+        prompt: str,
+        model: ModelName,
+    ) -> AsyncIterator[Union[str, ProviderResponse]]:
+        """
+        Find the provider that supports the given model and stream a response
+        (text deltas, then the final ProviderResponse).
+        """
+        return self._resolve(model).stream(prompt, model)
 
+    def _resolve(self, model: ModelName) -> BaseProvider:
+        """Return the provider for a model, or raise ValueError."""
+        provider = self._by_model.get(model)
+        if provider is None:
             raise ValueError(
                 f"No provider found for model: {model.value}. "
                 f"Available providers: {[type(p).__name__ for p in self._providers]}"
             )
-        except Exception:
-            traceback.print_exc()
-            raise
+        return provider
@@ -2,13 +2,15 @@
 OpenAI provider — handles GPT-4o and GPT-4o-mini via the OpenAI API.
 """
 
+import asyncio
 import os
+import ssl
 import time
-import traceback
 from pathlib import Path
+from typing import AsyncIterator, Optional, Union
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from backend.app.models import ModelName, ProviderName, ProviderResponse
 from backend.app.providers.base import BaseProvider
@@ -17,81 +19,263 @@ from backend.app.router import MODEL_REGISTRY
 _ENV_PATH = Path(__file__).resolve().parents[3] / ".env"
 load_dotenv(_ENV_PATH)
 
+# Opt-in cache of completions by (API model ID, prompt); see generate()
+_CACHE_ENABLED = os.getenv("GATEWAY_CACHE", "0") == "1"
+_CACHE_MAX_SIZE = 4096
+
 # Map our ModelName enum to the actual OpenAI API model IDs
 _MODEL_ID_MAP: dict[ModelName, str] = {
     ModelName.GPT_4O_MINI: "gpt-4o-mini",
     ModelName.GPT_4O: "gpt-4o",
 }
 
+# Membership set for supports_model()
+_SUPPORTED: frozenset[ModelName] = frozenset(_MODEL_ID_MAP)
+
+# (API model ID, $/1k input, $/1k output) per model, resolved once at import
+_DISPATCH: dict[ModelName, tuple[str, float, float]] = {
+    model: (
+        api_model_id,
+        MODEL_REGISTRY[model].cost_per_1k_input_tokens,
+        MODEL_REGISTRY[model].cost_per_1k_output_tokens,
+    )
+    for model, api_model_id in _MODEL_ID_MAP.items()
+}
+
+# ---------------------------------------------------------------------------
+# Shared client — one AsyncOpenAI (and one TLS context / connection pool)
+# per process, however many OpenAIProvider instances are created.
+# ---------------------------------------------------------------------------
+
+_client: Optional[AsyncOpenAI] = None
+
+
+def _get_client() -> AsyncOpenAI:
+    """Return the shared AsyncOpenAI client, creating it on first use."""
+    global _client
+    if _client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not set. Add it to your .env file.")
+        # Build the SSL context once (loading the CA bundle is the slow part)
+        # and keep the SDK's default pool limits and timeouts.
+        http_client = DefaultAsyncHttpxClient(verify=ssl.create_default_context())
+        _client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+    return _client
+
+
+# ---------------------------------------------------------------------------
+# Completion cache — (api_model_id, prompt) → (response_text, total_tokens).
+# Plain dict in LRU order; only touched from the event loop, so no lock.
+# Requests for a key already in flight await the same future instead of
+# issuing a duplicate API call.
+# ---------------------------------------------------------------------------
+
+_completion_cache: dict[tuple[str, str], tuple[str, int]] = {}
+_inflight: dict[tuple[str, str], asyncio.Future] = {}
+
+
+def _cache_get(key: tuple[str, str]) -> Optional[tuple[str, int]]:
+    """Return a cached completion and mark it most-recently-used."""
+    hit = _completion_cache.pop(key, None)
+    if hit is not None:
+        _completion_cache[key] = hit
+    return hit
+
+
+def _cache_put(key: tuple[str, str], value: tuple[str, int]) -> None:
+    """Store a completion, evicting the least-recently-used one when full."""
+    _completion_cache.pop(key, None)
+    if len(_completion_cache) >= _CACHE_MAX_SIZE:
+        del _completion_cache[next(iter(_completion_cache))]
+    _completion_cache[key] = value
+
 
 class OpenAIProvider(BaseProvider):
     """Real OpenAI API provider for GPT-4o and GPT-4o-mini."""
 
     def __init__(self) -> None:
-        try:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise ValueError("OPENAI_API_KEY not set. Add it to your .env file.")
-            self._client = OpenAI(api_key=api_key)
-        except Exception:
-            traceback.print_exc()
-            raise
+        self._client = _get_client()
 
     def supports_model(self, model: ModelName) -> bool:
         """Return True if model is a GPT variant we support."""
-        try:
-            return model in _MODEL_ID_MAP
-        except Exception:
-            traceback.print_exc()
-            raise
+        return model in _SUPPORTED
 
-    def generate(self, prompt: str, model: ModelName) -> ProviderResponse:
+    async def generate(self, prompt: str, model: ModelName) -> ProviderResponse:
         """
         Send prompt to OpenAI and return a ProviderResponse with real
         generated text, token usage, measured latency, and calculated cost.
+
+        With GATEWAY_CACHE=1, repeat (model, prompt) pairs are answered from
+        an in-process LRU without calling the API, and concurrent identical
+        requests share a single call. Shared answers cost nothing.
         """
-        try:
-            if not self.supports_model(model):
-                raise ValueError(f"OpenAIProvider does not support model: {model.value}")
-
-            api_model_id = _MODEL_ID_MAP[model]
-            model_info = MODEL_REGISTRY[model]
-
-            start = time.perf_counter()
-
-            response = self._client.chat.completions.create(
-                model=api_model_id,
-                max_tokens=1024,
-                temperature=0.7,
-                messages=[
-                    {"role": "user", "content": prompt},
-                ],
+        dispatch = _DISPATCH.get(model)
+        if dispatch is None:
+            raise ValueError(f"OpenAIProvider does not support model: {model.value}")
+        api_model_id, cost_per_1k_input, cost_per_1k_output = dispatch
+
+        start = time.perf_counter()
+
+        if not _CACHE_ENABLED:
+            response_text, input_tokens, output_tokens = await self._complete(
+                api_model_id, prompt,
             )
+        else:
+            cache_key = (api_model_id, prompt)
+            hit = _cache_get(cache_key)
+            if hit is not None:
+                return self._shared_response(model, hit, latency_ms=0)
 
-            latency_ms = int((time.perf_counter() - start) * 1000)
+            pending = _inflight.get(cache_key)
+            if pending is not None:
+                try:
+                    shared = await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    if not pending.cancelled():
+                        raise   # this request was cancelled, not the leader
+                    # Leader was cancelled; make our own call below
+                else:
+                    latency_ms = int((time.perf_counter() - start) * 1000)
+                    return self._shared_response(model, shared, latency_ms)
 
-            # Extract response data
-            response_text = response.choices[0].message.content or ""
-            input_tokens = response.usage.prompt_tokens if response.usage else 0
-            output_tokens = response.usage.completion_tokens if response.usage else 0
-            total_tokens = input_tokens + output_tokens
+            pending = asyncio.get_running_loop().create_future()
+            _inflight[cache_key] = pending
+            try:
+                response_text, input_tokens, output_tokens = await self._complete(
+                    api_model_id, prompt,
+                )
+            except Exception as e:
+                pending.set_exception(e)
+                pending.exception()   # mark retrieved if nobody was waiting
+                raise
+            else:
+                shared = (response_text, input_tokens + output_tokens)
+                _cache_put(cache_key, shared)
+                pending.set_result(shared)
+            finally:
+                # Cancelled mid-call: release waiters so they retry themselves
+                if not pending.done():
+                    pending.cancel()
+                if _inflight.get(cache_key) is pending:
+                    del _inflight[cache_key]
 
-            # Calculate cost
-            cost = self._calculate_cost(
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cost_per_1k_input=model_info.cost_per_1k_input_tokens,
-                cost_per_1k_output=model_info.cost_per_1k_output_tokens,
-            )
+        latency_ms = int((time.perf_counter() - start) * 1000)
 
-            return ProviderResponse(
-                model=model,
-                provider=ProviderName.OPENAI,
-                response_text=response_text,
-                tokens_used=total_tokens,
-                latency_ms=latency_ms,
-                simulated_cost=cost,
-            )
-        except Exception:
-            traceback.print_exc()
-            raise
+        # Calculate cost
+        cost = self._calculate_cost(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_per_1k_input=cost_per_1k_input,
+            cost_per_1k_output=cost_per_1k_output,
+        )
+
+        return ProviderResponse(
+            model=model,
+            provider=ProviderName.OPENAI,
+            response_text=response_text,
+            tokens_used=input_tokens + output_tokens,
+            latency_ms=latency_ms,
+            simulated_cost=cost,
+        )
+
+    async def stream(
+        self,
+        prompt: str,
+        model: ModelName,
+    ) -> AsyncIterator[Union[str, ProviderResponse]]:
+        """
+        Stream the completion: yield text deltas as OpenAI produces them,
+        then the final ProviderResponse. Usage is taken from the trailing
+        usage chunk. Streaming bypasses the completion cache.
+        """
+        dispatch = _DISPATCH.get(model)
+        if dispatch is None:
+            raise ValueError(f"OpenAIProvider does not support model: {model.value}")
+        api_model_id, cost_per_1k_input, cost_per_1k_output = dispatch
+
+        start = time.perf_counter()
+
+        stream = await self._client.chat.completions.create(
+            model=api_model_id,
+            max_tokens=1024,
+            temperature=0.7,
+            messages=[
+                {"role": "user", "content": prompt},
+            ],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        parts: list[str] = []
+        input_tokens = output_tokens = 0
+        # The context manager closes the HTTP response even if the consumer
+        # stops early (client disconnect), returning the connection to the pool
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+                if chunk.usage:
+                    input_tokens = chunk.usage.prompt_tokens
+                    output_tokens = chunk.usage.completion_tokens
+
+        latency_ms = int((time.perf_counter() - start) * 1000)
+
+        cost = self._calculate_cost(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_per_1k_input=cost_per_1k_input,
+            cost_per_1k_output=cost_per_1k_output,
+        )
+
+        yield ProviderResponse(
+            model=model,
+            provider=ProviderName.OPENAI,
+            response_text="".join(parts),
+            tokens_used=input_tokens + output_tokens,
+            latency_ms=latency_ms,
+            simulated_cost=cost,
+        )
+
+    async def _complete(self, api_model_id: str, prompt: str) -> tuple[str, int, int]:
+        """Call the API. Returns (response_text, input_tokens, output_tokens)."""
+        # Raw response: keeps the SDK's auth, retries and error mapping but
+        # skips building the full ChatCompletion model — only three fields
+        # are needed from the JSON body.
+        raw = await self._client.chat.completions.with_raw_response.create(
+            model=api_model_id,
+            max_tokens=1024,
+            temperature=0.7,
+            messages=[
+                {"role": "user", "content": prompt},
+            ],
+        )
+        data = raw.http_response.json()
+
+        response_text = data["choices"][0]["message"].get("content") or ""
+        usage = data.get("usage") or {}
+        return (
+            response_text,
+            usage.get("prompt_tokens", 0),
+            usage.get("completion_tokens", 0),
+        )
+
+    @staticmethod
+    def _shared_response(
+        model: ModelName,
+        shared: tuple[str, int],
+        latency_ms: int,
+    ) -> ProviderResponse:
+        """Build a zero-cost response from a cached or shared completion."""
+        response_text, total_tokens = shared
+        return ProviderResponse(
+            model=model,
+            provider=ProviderName.OPENAI,
+            response_text=response_text,
+            tokens_used=total_tokens,
+            latency_ms=latency_ms,
+            simulated_cost=0.0,
+        )
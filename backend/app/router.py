@@ -5,10 +5,12 @@ Takes a ClassificationResult (complexity score + task type) and selects the
 optimal model, building a step-by-step reasoning chain that the UI can display.
 """
 
-import traceback
+import functools
+from enum import IntEnum
 
 from backend.app.models import (
     ClassificationResult,
+    ClassifierMode,
     ModelInfo,
     ModelName,
     ProviderName,
@@ -53,33 +55,45 @@ MODEL_REGISTRY: dict[ModelName, ModelInfo] = {
 }
 
 
+# Baseline (most expensive) model used for cost comparisons
+_BASELINE: ModelInfo = MODEL_REGISTRY[ModelName.GPT_4O]
+_BASELINE_AVG_COST = (
+    _BASELINE.cost_per_1k_input_tokens + _BASELINE.cost_per_1k_output_tokens
+) / 2
+_BASELINE_LATENCY_MS = _BASELINE.avg_latency_ms
+
+
 # ---------------------------------------------------------------------------
 # Routing table — maps (complexity tier, task type) → model
 # ---------------------------------------------------------------------------
 
-# Complexity tiers
-_LOW = "low"        # 1-3
-_MEDIUM = "medium"  # 4-6
-_HIGH = "high"      # 7-10
+class _Tier(IntEnum):
+    """Complexity tiers. Values index the per-tier tuples below."""
+    LOW = 0      # 1-3
+    MEDIUM = 1   # 4-6
+    HIGH = 2     # 7-10
 
 
-def _get_tier(score: int) -> str:
-    """Map a 1-10 complexity score to a tier label."""
-    try:
-        if score <= 3:
-            return _LOW
-        elif score <= 6:
-            return _MEDIUM
-        else:
-            return _HIGH
-    except Exception:
-        traceback.print_exc()
-        raise
+# Short aliases keep the routing table readable
+_LOW, _MEDIUM, _HIGH = _Tier.LOW, _Tier.MEDIUM, _Tier.HIGH
+
+# Per-tier display text, indexed by _Tier
+_TIER_LABELS: tuple[str, ...] = ("LOW", "MEDIUM", "HIGH")
+_TIER_RANGES: tuple[str, ...] = ("1-3", "4-6", "7-10")
+
+
+# Complexity score (1-10) → tier; index 0 is unused
+_TIER_BY_SCORE: tuple[_Tier, ...] = (
+    _LOW,
+    _LOW, _LOW, _LOW,
+    _MEDIUM, _MEDIUM, _MEDIUM,
+    _HIGH, _HIGH, _HIGH, _HIGH,
+)
 
 
 # (tier, task_type) → ModelName
 # Explicit mappings; anything not listed falls through to tier defaults.
-_ROUTING_TABLE: dict[tuple[str, TaskType], ModelName] = {
+_ROUTING_TABLE: dict[tuple[_Tier, TaskType], ModelName] = {
     # --- LOW complexity (1-3) → GPT-4o-mini for everything ---
     (_LOW, TaskType.SIMPLE_QA):    ModelName.GPT_4O_MINI,
     (_LOW, TaskType.TRANSLATION):  ModelName.GPT_4O_MINI,
@@ -111,92 +125,167 @@ _ROUTING_TABLE: dict[tuple[str, TaskType], ModelName] = {
     (_HIGH, TaskType.SIMPLE_QA):    ModelName.GPT_4O,
 }
 
-# Tier-level defaults (fallback if a specific task_type is missing)
-_TIER_DEFAULTS: dict[str, ModelName] = {
-    _LOW:    ModelName.GPT_4O_MINI,
-    _MEDIUM: ModelName.GPT_4O_MINI,
-    _HIGH:   ModelName.GPT_4O,
-}
+# Tier-level defaults (fallback if a specific task_type is missing),
+# indexed by _Tier
+_TIER_DEFAULTS: tuple[ModelName, ...] = (
+    ModelName.GPT_4O_MINI,   # LOW
+    ModelName.GPT_4O_MINI,   # MEDIUM
+    ModelName.GPT_4O,        # HIGH
+)
+
+# Routing table regrouped by tier (tuple indexed by _Tier), with tier
+# defaults filled in for every task type, so route() does a tuple index and
+# one enum lookup and never builds a (tier, task_type) tuple key.
+_ROUTING_BY_TIER: tuple[dict[TaskType, ModelName], ...] = tuple(
+    {
+        task_type: _ROUTING_TABLE.get((tier, task_type), _TIER_DEFAULTS[tier])
+        for task_type in TaskType
+    }
+    for tier in _Tier
+)
 
 
 # ---------------------------------------------------------------------------
-# Reasoning chain builder
+# Route prototypes — everything about a routing decision that depends only
+# on (tier, task_type), formatted once at import
 # ---------------------------------------------------------------------------
 
-def _build_reasoning_chain(
-    classification: ClassificationResult,
-    tier: str,
-    chosen_model: ModelName,
-    model_info: ModelInfo,
-) -> list[ReasoningStep]:
-    """Construct the step-by-step reasoning chain for the routing decision."""
-    try:
-        steps: list[ReasoningStep] = []
+class _RoutePrototype:
+    """Pre-resolved model, pricing and reasoning steps for one (tier, task_type)."""
 
-        # Step 1 — Classification summary
-        steps.append(ReasoningStep(
-            step=1,
-            description=(
-                f"Prompt classified as '{classification.task_type.value}' "
-                f"with complexity {classification.complexity_score}/10 "
-                f"(confidence: {classification.confidence}) "
-                f"using {classification.classifier_mode.value} classifier."
-            ),
-        ))
+    __slots__ = (
+        "model", "provider", "avg_cost", "latency_ms", "fixed_steps",
+    )
 
-        # Step 2 — Tier assignment
-        tier_ranges = {_LOW: "1-3", _MEDIUM: "4-6", _HIGH: "7-10"}
-        steps.append(ReasoningStep(
-            step=2,
-            description=(
-                f"Complexity {classification.complexity_score} falls in the "
-                f"{tier.upper()} tier (range {tier_ranges[tier]})."
-            ),
-        ))
+    def __init__(self, tier: _Tier, task_type: TaskType) -> None:
+        chosen_model = _ROUTING_BY_TIER[tier][task_type]
+        model_info = MODEL_REGISTRY[chosen_model]
+
+        # Average cost per 1k tokens (input + output blend)
+        avg_cost = (model_info.cost_per_1k_input_tokens + model_info.cost_per_1k_output_tokens) / 2
+
+        self.model = chosen_model
+        self.provider = model_info.provider
+        self.avg_cost = round(avg_cost, 6)
+        self.latency_ms = model_info.avg_latency_ms
 
         # Step 3 — Model selection rationale
-        steps.append(ReasoningStep(
-            step=3,
-            description=(
-                f"For {tier.upper()} complexity + '{classification.task_type.value}' tasks, "
-                f"routing to {chosen_model.value} ({model_info.provider.value}). "
-                f"Strengths: {', '.join(model_info.strengths)}."
-            ),
-        ))
+        step3_text = (
+            f"For {_TIER_LABELS[tier]} complexity + '{task_type.value}' tasks, "
+            f"routing to {chosen_model.value} ({model_info.provider.value}). "
+            f"Strengths: {', '.join(model_info.strengths)}."
+        )
 
         # Step 4 — Cost & latency context
-        avg_cost = (model_info.cost_per_1k_input_tokens + model_info.cost_per_1k_output_tokens) / 2
-        baseline = MODEL_REGISTRY[ModelName.GPT_4O]
-        baseline_avg = (baseline.cost_per_1k_input_tokens + baseline.cost_per_1k_output_tokens) / 2
-
         if chosen_model == ModelName.GPT_4O:
-            cost_note = "This is the premium baseline model — no cost savings on this request."
+            step4_text = "This is the premium baseline model — no cost savings on this request."
         else:
-            savings = ((baseline_avg - avg_cost) / baseline_avg) * 100 if baseline_avg > 0 else 0
-            cost_note = (
+            savings = (
+                ((_BASELINE_AVG_COST - avg_cost) / _BASELINE_AVG_COST) * 100
+                if _BASELINE_AVG_COST > 0 else 0
+            )
+            step4_text = (
                 f"Estimated ~${avg_cost:.4f}/1k tokens vs "
-                f"${baseline_avg:.4f}/1k (GPT-4o baseline) — "
+                f"${_BASELINE_AVG_COST:.4f}/1k (GPT-4o baseline) — "
                 f"~{savings:.0f}% cost reduction."
             )
 
-        steps.append(ReasoningStep(
-            step=4,
-            description=cost_note,
-        ))
-
         # Step 5 — Latency note
-        steps.append(ReasoningStep(
-            step=5,
+        step5_text = (
+            f"Expected latency: ~{model_info.avg_latency_ms}ms "
+            f"(baseline GPT-4o: ~{_BASELINE_LATENCY_MS}ms)."
+        )
+
+        # Steps 3-5 are shared by reference across every decision for this
+        # (tier, task_type); ReasoningStep is frozen, so that is safe.
+        self.fixed_steps: tuple[ReasoningStep, ...] = (
+            ReasoningStep(step=3, description=step3_text),
+            ReasoningStep(step=4, description=step4_text),
+            ReasoningStep(step=5, description=step5_text),
+        )
+
+
+# Laid out like _ROUTING_BY_TIER: [tier][task_type] → prototype
+_PROTOTYPES: tuple[dict[TaskType, _RoutePrototype], ...] = tuple(
+    {task_type: _RoutePrototype(tier, task_type) for task_type in TaskType}
+    for tier in _Tier
+)
+
+
+# ---------------------------------------------------------------------------
+# Reasoning chain builder
+# ---------------------------------------------------------------------------
+
+# Enum member → string value, so per-request formatting skips the Enum
+# .value descriptor
+_TASK_TYPE_STR: dict[TaskType, str] = {t: t.value for t in TaskType}
+_CLASSIFIER_MODE_STR: dict[ClassifierMode, str] = {m: m.value for m in ClassifierMode}
+
+
+def _build_reasoning_chain(
+    complexity_score: int,
+    task_type: TaskType,
+    confidence: float,
+    classifier_mode: ClassifierMode,
+    tier: _Tier,
+    prototype: _RoutePrototype,
+) -> list[ReasoningStep]:
+    """
+    Construct the step-by-step reasoning chain for the routing decision.
+    Only steps 1-2 depend on the classification; steps 3-5 are prebuilt.
+    """
+    return [
+        # Step 1 — Classification summary
+        ReasoningStep(
+            step=1,
+            description=(
+                f"Prompt classified as '{_TASK_TYPE_STR[task_type]}' "
+                f"with complexity {complexity_score}/10 "
+                f"(confidence: {confidence}) "
+                f"using {_CLASSIFIER_MODE_STR[classifier_mode]} classifier."
+            ),
+        ),
+        # Step 2 — Tier assignment
+        ReasoningStep(
+            step=2,
             description=(
-                f"Expected latency: ~{model_info.avg_latency_ms}ms "
-                f"(baseline GPT-4o: ~{baseline.avg_latency_ms}ms)."
+                f"Complexity {complexity_score} falls in the "
+                f"{_TIER_LABELS[tier]} tier (range {_TIER_RANGES[tier]})."
             ),
-        ))
+        ),
+        *prototype.fixed_steps,
+    ]
+
+
+@functools.lru_cache(maxsize=512)
+def _route_cached(
+    complexity_score: int,
+    task_type: TaskType,
+    confidence: float,
+    classifier_mode: ClassifierMode,
+) -> RoutingDecision:
+    """
+    Build the RoutingDecision for one set of classification fields.
+
+    The decision depends on nothing else, so identical classifications are
+    served from an LRU cache. RoutingDecision is frozen, which makes handing
+    out the same instance to every caller safe.
+    """
+    tier = _TIER_BY_SCORE[complexity_score]
 
-        return steps
-    except Exception:
-        traceback.print_exc()
-        raise
+    # Model, pricing and steps 3-5 are precomputed per (tier, task_type)
+    prototype = _PROTOTYPES[tier][task_type]
+
+    return RoutingDecision(
+        model=prototype.model,
+        provider=prototype.provider,
+        reasoning_chain=_build_reasoning_chain(
+            complexity_score, task_type, confidence, classifier_mode,
+            tier, prototype,
+        ),
+        estimated_cost_per_1k_tokens=prototype.avg_cost,
+        estimated_latency_ms=prototype.latency_ms,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -208,48 +297,47 @@ def route(classification: ClassificationResult) -> RoutingDecision:
     Given a ClassificationResult, select the optimal model and return
     a full RoutingDecision with reasoning chain, cost, and latency.
     """
-    try:
-        tier = _get_tier(classification.complexity_score)
+    return _route_cached(
+        classification.complexity_score,
+        classification.task_type,
+        classification.confidence,
+        classification.classifier_mode,
+    )
 
-        # Look up model from routing table, fall back to tier default
-        key = (tier, classification.task_type)
-        chosen_model = _ROUTING_TABLE.get(key, _TIER_DEFAULTS[tier])
 
-        model_info = MODEL_REGISTRY[chosen_model]
+def get_all_models() -> list[ModelInfo]:
+    """Return metadata for every model in the registry (for GET /models)."""
+    return list(MODEL_REGISTRY.values())
 
-        # Build reasoning chain
-        reasoning_chain = _build_reasoning_chain(
-            classification, tier, chosen_model, model_info,
-        )
 
-        # Average cost per 1k tokens (input + output blend)
-        avg_cost = (model_info.cost_per_1k_input_tokens + model_info.cost_per_1k_output_tokens) / 2
+def get_baseline_model() -> ModelInfo:
+    """Return the baseline (most expensive) model info for cost comparisons."""
+    return _BASELINE
 
-        return RoutingDecision(
-            model=chosen_model,
-            provider=model_info.provider,
-            reasoning_chain=reasoning_chain,
-            estimated_cost_per_1k_tokens=round(avg_cost, 6),
-            estimated_latency_ms=model_info.avg_latency_ms,
-        )
-    except Exception:
-        traceback.print_exc()
-        raise
 
+# ---------------------------------------------------------------------------
+# Baseline pricing ratios
+# ---------------------------------------------------------------------------
 
-def get_all_models() -> list[ModelInfo]:
-    """Return metadata for every model in the registry (for GET /models)."""
-    try:
-        return list(MODEL_REGISTRY.values())
-    except Exception:
-        traceback.print_exc()
-        raise
+def _build_baseline_ratios() -> dict[ModelName, float]:
+    """
+    Map each model to (baseline avg $/1k) / (model avg $/1k).
 
+    Re-pricing a request at the baseline model then reduces to
+    cost * ratio. Models with no usable price map to 1.0 (cost unchanged).
+    """
+    ratios: dict[ModelName, float] = {}
+    for name, info in MODEL_REGISTRY.items():
+        model_avg_cost_per_1k = (
+            info.cost_per_1k_input_tokens + info.cost_per_1k_output_tokens
+        ) / 2
+        ratios[name] = (
+            _BASELINE_AVG_COST / model_avg_cost_per_1k
+            if model_avg_cost_per_1k > 0
+            else 1.0
+        )
+    return ratios
 
-def get_baseline_model() -> ModelInfo:
-    """Return the baseline (most expensive) model info for cost comparisons."""
-    try:
-        return MODEL_REGISTRY[ModelName.GPT_4O]
-    except Exception:
-        traceback.print_exc()
-        raise
+
+# Registry pricing is static, so the ratios are computed once at import.
+BASELINE_RATIO: dict[ModelName, float] = _build_baseline_ratios()
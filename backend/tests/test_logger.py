@@ -0,0 +1,74 @@
+"""Tests for the request logger's background writer."""
+
+from backend.app.classifier import rule_based
+from backend.app.logger import RequestLogger
+from backend.app.models import CostComparison, ProviderResponse, RouteResponse
+from backend.app.router import route
+
+
+def _route_response(prompt: str) -> RouteResponse:
+    classification = rule_based.classify(prompt)
+    routing = route(classification)
+    provider_response = ProviderResponse(
+        model=routing.model,
+        provider=routing.provider,
+        response_text="ok",
+        tokens_used=100,
+        latency_ms=250,
+        simulated_cost=0.0001,
+    )
+    return RouteResponse(
+        prompt=prompt,
+        classification=classification,
+        routing=routing,
+        response=provider_response,
+        cost_comparison=CostComparison(
+            chosen_model=routing.model,
+            chosen_cost=0.0001,
+            baseline_cost=0.001,
+            savings_percent=90.0,
+        ),
+    )
+
+
+def test_close_flushes_pending_entries(monkeypatch):
+    # Keep the writer thread idle so every entry is still queued at close()
+    monkeypatch.setattr(RequestLogger, "_writer_loop", lambda self: None)
+    logger = RequestLogger()
+    prompts = ["What is 2+2?", "Write a haiku about the ocean", "Compare REST vs GraphQL"]
+    for prompt in prompts:
+        logger.log_async(_route_response(prompt))
+    assert len(logger._pending) == len(prompts)
+
+    logger.close()
+
+    assert not logger._pending
+    assert [entry.prompt_snippet for entry in logger._entries] == prompts
+    assert logger.count == len(prompts)
+
+
+def test_bad_queued_entry_is_skipped(monkeypatch):
+    # Keep the writer thread idle so the readers do the flushing
+    monkeypatch.setattr(RequestLogger, "_writer_loop", lambda self: None)
+    logger = RequestLogger()
+    logger.log_async(_route_response("What is 2+2?"))
+    logger.log_async(object())  # fails LogEntry.from_route_response
+    logger.log_async(_route_response("Write a haiku about the ocean"))
+
+    stats = logger.get_stats()
+
+    assert stats.total_requests == 2
+    assert not logger._pending
+    assert [entry.prompt_snippet for entry in logger._entries] == [
+        "What is 2+2?", "Write a haiku about the ocean",
+    ]
+    logger.close()
+
+
+def test_close_stops_writer_thread():
+    logger = RequestLogger()
+    logger.log_async(_route_response("What is 2+2?"))
+    logger.close()
+
+    assert not logger._writer.is_alive()
+    assert logger.count == 1
@@ -0,0 +1,89 @@
+"""
+Regression tests for the rule-based classifier.
+
+Scores are pinned to the original heuristics: token estimation feeds the
+length bonus, so whitespace handling changes routing, not just speed.
+"""
+
+from backend.app.classifier import rule_based
+from backend.app.models import TaskType
+
+# Small indented snippet — runs of spaces must count as one separator
+_INDENTED_SNIPPET = (
+    "Fix this function:\n"
+    "def load(path):\n"
+    "    with open(path) as f:\n"
+    "        for line in f:\n"
+    "            if line.strip():\n"
+    "                yield line\n"
+)
+
+# Tabs separate words just like spaces
+_TABBED_PROMPT = "Translate to French:\n\tHello\tworld\n\tGood\tmorning\tto\tyou"
+
+# ~1.2 KB indented code paste, just under the 200-token length bonus
+_LARGE_INDENTED_PASTE = "Refactor this code:\n" + "".join(
+    f"def handler_{i}(request):\n"
+    f"        if request.user is None:\n"
+    f"            return error_{i}\n"
+    f"        return response_{i}(request)\n"
+    for i in range(10)
+)
+
+
+def test_token_estimate_matches_split_word_count():
+    for prompt in (_INDENTED_SNIPPET, _TABBED_PROMPT, _LARGE_INDENTED_PASTE, "  a  b\t\tc \n"):
+        words = len(prompt.split())
+        expected = max(int((words * 0.75 + len(prompt) / 4) / 2), 1)
+        assert rule_based._estimate_token_count(prompt) == expected
+
+
+def test_indented_snippet_score():
+    result = rule_based.classify(_INDENTED_SNIPPET)
+    assert result.task_type == TaskType.CODE
+    assert result.complexity_score == 5
+    assert "~23 tokens" in result.reasoning
+
+
+def test_tabbed_prompt_score():
+    result = rule_based.classify(_TABBED_PROMPT)
+    assert result.task_type == TaskType.TRANSLATION
+    assert result.complexity_score == 3
+    assert "~10 tokens" in result.reasoning
+
+
+def test_large_indented_paste_score():
+    result = rule_based.classify(_LARGE_INDENTED_PASTE)
+    assert result.task_type == TaskType.CODE
+    assert result.complexity_score == 6
+    assert "~189 tokens" in result.reasoning
+
+
+# Non-ASCII prompts must classify exactly as the original re.I patterns did:
+# str.lower() differs from re.I case-insensitivity outside ASCII.
+
+def test_long_s_matches_simple_reducer():
+    result = rule_based.classify("Give me a ſimple summary of this")
+    assert result.task_type == TaskType.GENERAL
+    assert result.complexity_score == 2
+    assert result.reasoning.endswith("-1: explicitly simple/basic")
+
+
+def test_dotted_capital_i_keeps_short_prompt_length():
+    # 30 characters, but "İ".lower() is two code points
+    prompt = "Who founded İzmir city exactly"
+    assert len(prompt) == 30
+    result = rule_based.classify(prompt)
+    assert result.task_type == TaskType.SIMPLE_QA
+    assert result.complexity_score == 1
+    assert result.reasoning.endswith("-1: very short prompt")
+
+
+def test_long_s_matches_translation_keyword():
+    result = rule_based.classify("Tranſlate good night into French")
+    assert result.task_type == TaskType.TRANSLATION
+    assert result.complexity_score == 3
+    assert result.reasoning == (
+        "translation request detected | base score 3 for task type 'translation'"
+        " | short prompt (~5 tokens, +0)"
+    )
@@ -7,19 +7,31 @@ Tabs:
   3. Analytics — cost savings, model distribution charts
 """
 
+import html
+import json
+import threading
+import time
 import traceback
+from collections import OrderedDict
+from collections.abc import Iterator
 
 import requests
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
+from requests.adapters import HTTPAdapter
+import streamlit.components.v1 as components
 import pandas as pd
+import pyarrow as pa
 
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
 API_BASE = "http://localhost:8000"
+HEALTH_POLL_INTERVAL_S = 10
+
+# Client-side route cache, mirroring the backend's own response cache
+ROUTE_CACHE_TTL_S = 1800
+ROUTE_CACHE_MAX_ENTRIES = 100
 
 st.set_page_config(
     page_title="AI Gateway",
@@ -28,6 +40,105 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# ---------------------------------------------------------------------------
+# JSON decoder — orjson if available, stdlib json otherwise. Both accept
+# the raw response bytes, which skips requests' own text decoding.
+# ---------------------------------------------------------------------------
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ---------------------------------------------------------------------------
+# Shared resources — one per server process, across all sessions and reruns
+# ---------------------------------------------------------------------------
+
+@st.cache_resource(show_spinner=False)
+def get_session() -> requests.Session:
+    """Pooled HTTP session, so reruns reuse keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _poll_health(session: requests.Session, state: dict) -> None:
+    """Fetch /health into the shared state; None means the backend is down."""
+    try:
+        resp = session.get(f"{API_BASE}/health", timeout=5)
+        resp.raise_for_status()
+        state["health"] = _json_loads(resp.content)
+    except requests.exceptions.RequestException:
+        state["health"] = None
+    except Exception:
+        state["health"] = None
+        traceback.print_exc()
+
+
+def _health_poll_loop(session: requests.Session, state: dict) -> None:
+    """Daemon loop: refresh the shared health state every few seconds."""
+    while True:
+        time.sleep(HEALTH_POLL_INTERVAL_S)
+        _poll_health(session, state)
+
+
+@st.cache_resource(show_spinner=False)
+def health_state() -> dict:
+    """
+    Shared {"health": ...} dict kept fresh by a background poller thread.
+
+    The sidebar reads it without blocking, so /health is off the critical
+    path of every rerun.
+    """
+    session = get_session()
+    state = {"health": None}
+    _poll_health(session, state)
+    threading.Thread(
+        target=_health_poll_loop,
+        args=(session, state),
+        name="health-poller",
+        daemon=True,
+    ).start()
+    return state
+
+
+@st.cache_resource(show_spinner=False)
+def _route_cache() -> tuple[OrderedDict, threading.Lock]:
+    """(prompt, classifier_mode) → (stored_at, RouteResponse), in LRU order."""
+    return OrderedDict(), threading.Lock()
+
+
+def cached_route(prompt: str, classifier_mode: str) -> dict | None:
+    """Return a recent RouteResponse for this prompt and mode, if any."""
+    cache, lock = _route_cache()
+    key = (prompt, classifier_mode)
+    with lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > ROUTE_CACHE_TTL_S:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return result
+
+
+def remember_route(prompt: str, classifier_mode: str, result: dict) -> None:
+    """Store a RouteResponse, evicting the least recently used entry when full."""
+    cache, lock = _route_cache()
+    key = (prompt, classifier_mode)
+    with lock:
+        cache[key] = (time.monotonic(), result)
+        cache.move_to_end(key)
+        while len(cache) > ROUTE_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -36,9 +147,9 @@ def api_call(method: str, endpoint: str, **kwargs) -> dict | list | None:
     """Make an API call to the backend and return JSON, or None on error."""
     try:
         url = f"{API_BASE}{endpoint}"
-        resp = requests.request(method, url, timeout=120, **kwargs)
+        resp = get_session().request(method, url, timeout=120, **kwargs)
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
     except requests.exceptions.ConnectionError:
         st.error("Cannot connect to backend. Make sure the API is running on port 8000.")
         traceback.print_exc()
@@ -53,32 +164,420 @@ def api_call(method: str, endpoint: str, **kwargs) -> dict | list | None:
         return None
 
 
-def complexity_color(score: int) -> str:
-    """Return a color for the complexity score."""
+def _iter_sse(resp: requests.Response) -> Iterator[tuple[str, str]]:
+    """Yield (event, data) pairs from a text/event-stream response."""
+    event, data = "message", []
+    for raw in resp.iter_lines():
+        line = raw.decode("utf-8")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[6:].strip()
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip())
+
+
+def stream_route(prompt: str, classifier_mode: str, outcome: dict) -> Iterator[str]:
+    """
+    POST to /route/stream and yield the response text as it is generated.
+
+    Errors are not raised: the final RouteResponse lands in
+    outcome["result"], or a message in outcome["error"], once the
+    generator is exhausted.
+    """
     try:
-        if score <= 3:
-            return "#2ecc71"   # green
-        elif score <= 6:
-            return "#f39c12"   # orange
-        else:
-            return "#e74c3c"   # red
-    except Exception:
+        with get_session().post(
+            f"{API_BASE}/route/stream",
+            json={"prompt": prompt, "classifier_mode": classifier_mode},
+            stream=True,
+            timeout=120,
+        ) as resp:
+            resp.raise_for_status()
+            for event, data in _iter_sse(resp):
+                payload = _json_loads(data)
+                if event == "delta":
+                    yield payload["text"]
+                elif event == "done":
+                    outcome["result"] = payload
+                elif event == "error":
+                    outcome["error"] = f"API error: {payload['detail']}"
+    except requests.exceptions.ConnectionError:
+        outcome["error"] = "Cannot connect to backend. Make sure the API is running on port 8000."
+        traceback.print_exc()
+    except requests.exceptions.HTTPError as e:
+        outcome["error"] = f"API error: {e.response.status_code} — {e.response.text}"
         traceback.print_exc()
-        return "#95a5a6"
+    except Exception as e:
+        outcome["error"] = f"Unexpected error: {e}"
+        traceback.print_exc()
+
+
+# Read-only endpoints are cached so ordinary reruns (typing, clicking,
+# switching tabs) don't block on a round-trip to the backend.
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_models() -> list | None:
+    return api_call("GET", "/models")
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _get_stats() -> dict | None:
+    return api_call("GET", "/stats")
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _get_logs(limit: int = 100) -> list | None:
+    return api_call("GET", f"/logs?limit={limit}")
+
+
+def _invalidate_request_caches() -> None:
+    """Refresh health and drop cached stats/logs after a new request is logged."""
+    _poll_health(get_session(), health_state())
+    _get_stats.clear()
+    _get_logs.clear()
+
+
+_CARD_TPL = (
+    '<div style="flex:1; text-align:center; padding:10px; border-radius:10px; '
+    'border: 2px solid {color}; background: {color}15;">'
+    '<div style="font-size:{size}px; font-weight:bold; color:{color};">{value}</div>'
+    '<div style="font-size:14px; color:{color};">{label}</div>'
+    '</div>'
+)
+_CARD_ROW_TPL = '<div style="display:flex; gap:16px;">{cards}</div>'
+
+# Classifier reasoning with a CSS confidence bar underneath
+_CONFIDENCE_TPL = (
+    '<div style="padding:12px 16px; border-radius:8px; background:#3498db1a; color:#1c5a85;">'
+    '{reasoning}'
+    '<div style="margin-top:10px; height:6px; border-radius:3px; background:#3498db33;">'
+    '<div style="width:{percent:.0f}%; height:6px; border-radius:3px; background:#3498db;"></div>'
+    '</div>'
+    '<div style="margin-top:4px; font-size:13px;">Confidence: {percent:.0f}%</div>'
+    '</div>'
+)
+
+
+def card(value, label: str, color: str, big: bool = True) -> str:
+    """Render one summary card from the shared HTML template."""
+    return _CARD_TPL.format_map({
+        "value": value, "label": label, "color": color, "size": 36 if big else 20,
+    })
+
+
+# Indexed by complexity score 0-10: 1-3 LOW, 4-6 MEDIUM, 7-10 HIGH
+_SCORE_COLORS: tuple[str, ...] = ("#2ecc71",) * 4 + ("#f39c12",) * 3 + ("#e74c3c",) * 4
+_SCORE_TIERS: tuple[str, ...] = ("LOW",) * 4 + ("MEDIUM",) * 3 + ("HIGH",) * 4
+
+
+def complexity_color(score: int) -> str:
+    """Return a color for the complexity score."""
+    return _SCORE_COLORS[max(0, min(10, score))]
 
 
 def tier_label(score: int) -> str:
     """Return a human-readable tier label."""
-    try:
-        if score <= 3:
-            return "LOW"
-        elif score <= 6:
-            return "MEDIUM"
-        else:
-            return "HIGH"
-    except Exception:
-        traceback.print_exc()
-        return "UNKNOWN"
+    return _SCORE_TIERS[max(0, min(10, score))]
+
+
+# ---------------------------------------------------------------------------
+# Chart builders
+#
+# Figures are cached as plain dicts keyed on their input data, so a rerun
+# with unchanged stats skips Plotly's figure assembly entirely. Plotly is
+# imported inside the builders: it is slow to import, and sessions that
+# never produce a chart don't need it.
+# ---------------------------------------------------------------------------
+
+@st.cache_data(show_spinner=False)
+def build_cost_chart(chosen_model: str, baseline_model: str, chosen_cost: float, baseline_cost: float) -> dict:
+    """Bar chart of the chosen model's cost against the baseline."""
+    import plotly.express as px
+
+    cost_df = pd.DataFrame({
+        "Model": [chosen_model, baseline_model],
+        "Cost ($)": [chosen_cost, baseline_cost],
+    })
+    fig = px.bar(
+        cost_df, x="Model", y="Cost ($)",
+        color="Model",
+        color_discrete_sequence=["#2ecc71", "#e74c3c"],
+        title="Cost: Chosen vs Baseline (GPT-4o)",
+    )
+    fig.update_layout(showlegend=False, height=280)
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def build_usage_pie(model_usage: list[dict]) -> dict:
+    """Donut chart of request count per model."""
+    import plotly.express as px
+
+    fig = px.pie(
+        pd.DataFrame(model_usage),
+        values="request_count",
+        names="model",
+        color_discrete_sequence=px.colors.qualitative.Set2,
+        hole=0.4,
+    )
+    fig.update_layout(height=380)
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def build_cost_by_model(model_usage: list[dict]) -> dict:
+    """Bar chart of total cost per model."""
+    import plotly.express as px
+
+    fig = px.bar(
+        pd.DataFrame(model_usage),
+        x="model",
+        y="total_cost",
+        color="model",
+        color_discrete_sequence=px.colors.qualitative.Set2,
+        labels={"total_cost": "Total Cost ($)", "model": "Model"},
+    )
+    fig.update_layout(showlegend=False, height=380)
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def build_latency_by_model(model_usage: list[dict]) -> dict:
+    """Bar chart of average latency per model."""
+    import plotly.express as px
+
+    fig = px.bar(
+        pd.DataFrame(model_usage),
+        x="model",
+        y="avg_latency_ms",
+        color="model",
+        color_discrete_sequence=px.colors.qualitative.Pastel,
+        labels={"avg_latency_ms": "Avg Latency (ms)", "model": "Model"},
+    )
+    fig.update_layout(showlegend=False, height=350)
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def build_savings_gauge(savings_percent: float) -> dict:
+    """Gauge of overall savings against the GPT-4o baseline."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=savings_percent,
+        number={"suffix": "%"},
+        title={"text": "Overall Savings vs GPT-4o Baseline"},
+        delta={"reference": 50, "increasing": {"color": "#2ecc71"}},
+        gauge={
+            "axis": {"range": [0, 100]},
+            "bar": {"color": "#2ecc71"},
+            "steps": [
+                {"range": [0, 30], "color": "#fadbd8"},
+                {"range": [30, 70], "color": "#fdebd0"},
+                {"range": [70, 100], "color": "#d5f5e3"},
+            ],
+        },
+    ))
+    fig.update_layout(height=350)
+    return fig.to_dict()
+
+
+# All Analytics charts go into one HTML component that loads plotly.js once,
+# instead of one st.plotly_chart (and one plotly.js init) per figure.
+_PLOTLYJS_CDN_TPL = "https://cdn.plot.ly/plotly-{version}.min.js"
+_ANALYTICS_HTML_HEIGHT = 860
+_ANALYTICS_CELL_TPL = (
+    '<div class="cell"><h3>{title}</h3><div id="chart-{i}"></div></div>'
+    '<script>Plotly.newPlot("chart-{i}", {fig}.data, {fig}.layout, '
+    '{{"responsive": true, "displaylogo": false}});</script>'
+)
+_ANALYTICS_HTML_TPL = (
+    '<script src="{src}"></script>'
+    '<style>'
+    'body {{ margin: 0; font-family: "Source Sans Pro", sans-serif; }}'
+    '.grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 16px; }}'
+    'h3 {{ margin: 8px 0; font-weight: 600; }}'
+    '</style>'
+    '<div class="grid">{cells}</div>'
+)
+
+
+@st.cache_data(show_spinner=False)
+def build_analytics_html(model_usage: list[dict], savings_percent: float) -> str:
+    """Render the four Analytics charts as a single HTML document."""
+    import plotly.io as pio
+    from plotly.offline import get_plotlyjs_version
+
+    figures = [
+        ("Model Distribution", build_usage_pie(model_usage)),
+        ("Cost by Model", build_cost_by_model(model_usage)),
+        ("Average Latency by Model", build_latency_by_model(model_usage)),
+        ("Cost Efficiency", build_savings_gauge(savings_percent)),
+    ]
+    cells = "".join(
+        _ANALYTICS_CELL_TPL.format(i=i, title=title, fig=pio.to_json(fig, validate=False))
+        for i, (title, fig) in enumerate(figures)
+    )
+    src = _PLOTLYJS_CDN_TPL.format(version=get_plotlyjs_version())
+    return _ANALYTICS_HTML_TPL.format(src=src, cells=cells)
+
+
+# ---------------------------------------------------------------------------
+# Table builders
+# ---------------------------------------------------------------------------
+
+# /logs field → History column, in display order
+_LOG_COLUMNS: dict[str, str] = {
+    "timestamp": "Timestamp",
+    "prompt_snippet": "Prompt",
+    "classifier_mode": "Classifier",
+    "complexity_score": "Score",
+    "task_type": "Task Type",
+    "routed_model": "Model",
+    "latency_ms": "Latency (ms)",
+    "cost": "Cost ($)",
+}
+
+
+@st.cache_data(show_spinner=False)
+def build_logs_table(logs: list[dict]) -> pa.Table:
+    """
+    Build the History table straight into Arrow.
+
+    st.dataframe ships Arrow to the browser anyway, so this skips the
+    pandas dtype inference and the pandas → Arrow conversion.
+    """
+    table = pa.Table.from_pylist(logs).select(list(_LOG_COLUMNS))
+    return table.rename_columns(list(_LOG_COLUMNS.values()))
+
+
+@st.cache_data(show_spinner=False)
+def build_models_table(models: list[dict]) -> pa.Table:
+    """Sidebar model list as one table instead of an expander per model."""
+    return pa.table({
+        "Model": [m["name"] for m in models],
+        "Provider": [m["provider"] for m in models],
+        "Input ($/1k)": [m["cost_per_1k_input_tokens"] for m in models],
+        "Output ($/1k)": [m["cost_per_1k_output_tokens"] for m in models],
+        "Latency (ms)": [m["avg_latency_ms"] for m in models],
+        "Strengths": [", ".join(m["strengths"]) for m in models],
+    })
+
+
+# ---------------------------------------------------------------------------
+# How It Works — static content
+#
+# Built once at import; the tab body only references these.
+# ---------------------------------------------------------------------------
+
+_ARCH_DIAGRAM = """
+    User Prompt
+         │
+         ▼
+    ┌─────────────────┐
+    │   Classifier     │  ← Rule-Based (heuristics) OR LLM-Based (Claude Haiku)
+    │   Output:        │
+    │   - Score (1-10) │
+    │   - Task Type    │
+    │   - Reasoning    │
+    └────────┬────────┘
+             │
+             ▼
+    ┌─────────────────┐
+    │   Router         │  ← Maps (complexity tier + task type) → best model
+    │   Output:        │
+    │   - Model choice │
+    │   - 5-step chain │
+    │   - Cost estimate│
+    └────────┬────────┘
+             │
+             ▼
+    ┌─────────────────┐
+    │   Provider       │  ← Real API call to OpenAI or Anthropic
+    │   Output:        │
+    │   - Response text│
+    │   - Token count  │
+    │   - Actual cost  │
+    └─────────────────┘
+    """
+
+_RULE_CARD_HTML = (
+    '<div style="padding:20px; border-radius:12px; border:2px solid #3498db; background:#3498db10;">'
+    '<h3 style="color:#3498db; margin-top:0;">Rule-Based Classifier</h3>'
+    '</div>'
+)
+
+_LLM_CARD_HTML = (
+    '<div style="padding:20px; border-radius:12px; border:2px solid #9b59b6; background:#9b59b610;">'
+    '<h3 style="color:#9b59b6; margin-top:0;">LLM-Based Classifier</h3>'
+    '</div>'
+)
+
+_EXAMPLE_JSON = """{
+  "complexity_score": 6,
+  "task_type": "code",
+  "reasoning": "This requires writing functional code with error
+    handling, involving HTTP requests, parsing, and exception
+    management. Moderately complex.",
+  "confidence": 0.92
+}"""
+
+_TASK_EXAMPLES: dict[str, str] = {
+    "Code": '`python`, `function`, `debug`, `api`, `build`...',
+    "Math": '`solve`, `integral`, `equation`, `probability`...',
+    "Creative": '`poem`, `story`, `haiku`, `compose`, `fiction`...',
+    "Analysis": '`analyze`, `compare`, `pros and cons`, `evaluate`...',
+    "Translation": '`translate`, `in french`, `in spanish`...',
+    "Reasoning": '`step by step`, `quantum`, `philosophy`, `paradox`...',
+    "Simple QA": '`what is`, `capital of`, `define`, `how many`...',
+}
+_TASK_EXAMPLES_MD = "\n".join(f"- **{task}:** {examples}" for task, examples in _TASK_EXAMPLES.items())
+
+_BOOST_DF = pd.DataFrame({
+    "Signal": ["'step by step', 'detailed'", "'compare', 'trade-offs'",
+               "'advanced', 'complex'", "'architecture', 'system design'",
+               "'simple', 'basic', 'easy'", "'yes or no'", "Very short prompt (<30 chars)"],
+    "Effect": ["+2", "+1", "+2", "+2", "-1", "-2", "-1"],
+})
+
+_ROUTING_DF = pd.DataFrame({
+    "Complexity": ["1-3 (Low)", "4-6 (Medium)", "4-6 (Medium)", "7-10 (High)", "7-10 (High)"],
+    "Task Types": [
+        "All types",
+        "Code, Math, General, Simple QA",
+        "Analysis, Creative, Translation, Reasoning",
+        "Reasoning, Math, Code, Simple QA",
+        "Analysis, Creative, General, Translation",
+    ],
+    "Model": [
+        "GPT-4o-mini",
+        "GPT-4o-mini", "Claude 3.5 Sonnet",
+        "GPT-4o", "Claude 3.5 Sonnet",
+    ],
+    "Why": [
+        "Fast and cheapest option for simple tasks",
+        "Cost-effective for standard code and math",
+        "Excels at nuanced, creative, and analytical work",
+        "Top-tier reasoning for the hardest problems",
+        "Best at long-form analysis and creative content",
+    ],
+})
+
+_MODEL_DF = pd.DataFrame({
+    "Model": ["GPT-4o-mini", "Claude 3.5 Sonnet", "GPT-4o"],
+    "Provider": ["OpenAI", "Anthropic", "OpenAI"],
+    "Input Cost ($/1k tokens)": ["$0.00015", "$0.003", "$0.005"],
+    "Output Cost ($/1k tokens)": ["$0.0006", "$0.015", "$0.015"],
+    "Avg Latency": ["~300ms", "~700ms", "~800ms"],
+    "Best For": [
+        "Simple QA, translations, basic code",
+        "Analysis, creative writing, nuanced content",
+        "Complex math, advanced reasoning, hard code",
+    ],
+})
 
 
 # ---------------------------------------------------------------------------
@@ -90,41 +589,49 @@ with st.sidebar:
     st.caption("Intelligent LLM Router")
     st.divider()
 
-    # Health check
-    health = api_call("GET", "/health")
-    if health:
-        st.metric("Models Available", health["models_available"])
-        st.metric("Requests Logged", health["total_requests_logged"])
-        cache = health["cache_stats"]
-        st.metric("Cache Hit Rate", f"{cache['hit_rate_percent']}%")
-        st.caption(f"Cache: {cache['size']}/{cache['max_size']} entries")
-    else:
-        st.warning("Backend offline")
+    # Health check — one persistent placeholder, redrawn in place so an
+    # unchanged health snapshot produces no frontend churn
+    status = st.empty()
+    health = health_state()["health"]
+    with status.container():
+        if health:
+            st.metric("Models Available", health["models_available"])
+            st.metric("Requests Logged", health["total_requests_logged"])
+            cache = health["cache_stats"]
+            st.metric("Cache Hit Rate", f"{cache['hit_rate_percent']}%")
+            st.caption(f"Cache: {cache['size']}/{cache['max_size']} entries")
+        else:
+            st.warning("Backend offline")
 
     st.divider()
 
     # Models info
-    models = api_call("GET", "/models")
+    models = _get_models()
     if models:
         st.subheader("Available Models")
-        for m in models:
-            with st.expander(f"{m['name']}"):
-                st.caption(f"Provider: **{m['provider']}**")
-                st.caption(f"Input: ${m['cost_per_1k_input_tokens']:.4f}/1k tokens")
-                st.caption(f"Output: ${m['cost_per_1k_output_tokens']:.4f}/1k tokens")
-                st.caption(f"Avg latency: {m['avg_latency_ms']}ms")
-                st.caption(f"Strengths: {', '.join(m['strengths'])}")
+        st.dataframe(
+            build_models_table(models),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Input ($/1k)": st.column_config.NumberColumn(format="$%.4f"),
+                "Output ($/1k)": st.column_config.NumberColumn(format="$%.4f"),
+                "Latency (ms)": st.column_config.NumberColumn(format="%d ms"),
+            },
+        )
 
 
 # ---------------------------------------------------------------------------
 # Main content — Tabs
+#
+# Each tab is a render function and only the selected one runs, so a rerun
+# on the Router tab doesn't also fetch logs/stats and build every chart.
 # ---------------------------------------------------------------------------
 
-tab_router, tab_history, tab_analytics, tab_how_it_works = st.tabs(["Router", "History", "Analytics", "How It Works"])
-
 # ============================= ROUTER TAB ================================
 
-with tab_router:
+def render_router() -> None:
+    """Prompt input, routing, and the result panel."""
     st.header("Route a Prompt")
 
     col_input, col_config = st.columns([3, 1])
@@ -146,128 +653,102 @@ with tab_router:
 
     route_clicked = st.button("Route Prompt", type="primary", use_container_width=True, disabled=not prompt.strip())
 
-    if route_clicked and prompt.strip():
-        with st.spinner("Classifying, routing, and generating response..."):
-            result = api_call(
-                "POST", "/route",
-                json={"prompt": prompt.strip(), "classifier_mode": classifier_mode},
-            )
+    cached_result = cached_route(prompt.strip(), classifier_mode) if route_clicked else None
+
+    if cached_result is not None:
+        # Same prompt and mode as a recent request: skip the round-trip
+        st.session_state["route_result"] = cached_result
+    elif route_clicked and prompt.strip():
+        # Show the response text as it streams in; it is replaced by the
+        # full result panel below once the final event arrives.
+        outcome: dict = {}
+        live = st.empty()
+        with live.container(), st.spinner("Classifying, routing, and generating response..."):
+            st.subheader("Model Response")
+            st.write_stream(stream_route(prompt.strip(), classifier_mode, outcome))
+        live.empty()
+
+        if "error" in outcome:
+            st.error(outcome["error"])
+        elif "result" in outcome:
+            remember_route(prompt.strip(), classifier_mode, outcome["result"])
+            _invalidate_request_caches()
+            # Kept in session state so the result survives switching tabs
+            st.session_state["route_result"] = outcome["result"]
+
+    result = st.session_state.get("route_result")
+    if result:
+        st.divider()
+
+        # --- Row 1: Classification + Routing summary ---
+        score = result["classification"]["complexity_score"]
+        task_type = result["classification"]["task_type"]
+        model = result["routing"]["model"]
+        provider = result["routing"]["provider"]
+
+        savings = result["cost_comparison"]["savings_percent"]
+        savings_color = "#2ecc71" if savings > 0 else "#95a5a6"
+
+        cards = (
+            card(f"{score}/10", f"{tier_label(score)} complexity", complexity_color(score))
+            + card(task_type.replace("_", " ").title(), "Task Type", "#3498db", big=False)
+            + card(model, provider, "#9b59b6", big=False)
+            + card(f"{savings}%", "Cost Saved", savings_color)
+        )
+        st.markdown(_CARD_ROW_TPL.format(cards=cards), unsafe_allow_html=True)
 
-        if result:
-            st.divider()
+        st.divider()
 
-            # --- Row 1: Classification + Routing summary ---
-            c1, c2, c3, c4 = st.columns(4)
-
-            score = result["classification"]["complexity_score"]
-            task_type = result["classification"]["task_type"]
-            model = result["routing"]["model"]
-            provider = result["routing"]["provider"]
-
-            with c1:
-                color = complexity_color(score)
-                st.markdown(
-                    f"""
-                    <div style="text-align:center; padding:10px; border-radius:10px;
-                                border: 2px solid {color}; background: {color}15;">
-                        <div style="font-size:36px; font-weight:bold; color:{color};">{score}/10</div>
-                        <div style="font-size:14px; color:{color};">{tier_label(score)} complexity</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+        # --- Row 2: Response + Details side by side ---
+        col_resp, col_details = st.columns([3, 2])
 
-            with c2:
-                st.markdown(
-                    f"""
-                    <div style="text-align:center; padding:10px; border-radius:10px;
-                                border: 2px solid #3498db; background: #3498db15;">
-                        <div style="font-size:20px; font-weight:bold; color:#3498db;">{task_type.replace('_', ' ').title()}</div>
-                        <div style="font-size:14px; color:#3498db;">Task Type</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+        with col_resp:
+            st.subheader("Model Response")
+            st.markdown(result["response"]["response_text"])
 
-            with c3:
-                st.markdown(
-                    f"""
-                    <div style="text-align:center; padding:10px; border-radius:10px;
-                                border: 2px solid #9b59b6; background: #9b59b615;">
-                        <div style="font-size:20px; font-weight:bold; color:#9b59b6;">{model}</div>
-                        <div style="font-size:14px; color:#9b59b6;">{provider}</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+            # Response metadata
+            resp = result["response"]
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Tokens Used", resp["tokens_used"])
+            m2.metric("Latency", f"{resp['latency_ms']}ms")
+            m3.metric("Cost", f"${resp['simulated_cost']:.6f}")
 
-            with c4:
-                savings = result["cost_comparison"]["savings_percent"]
-                savings_color = "#2ecc71" if savings > 0 else "#95a5a6"
-                st.markdown(
-                    f"""
-                    <div style="text-align:center; padding:10px; border-radius:10px;
-                                border: 2px solid {savings_color}; background: {savings_color}15;">
-                        <div style="font-size:36px; font-weight:bold; color:{savings_color};">{savings}%</div>
-                        <div style="font-size:14px; color:{savings_color};">Cost Saved</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+        with col_details:
+            # Reasoning chain
+            st.subheader("Routing Reasoning")
+            st.markdown("\n\n".join(
+                f"**Step {step['step']}:** {step['description']}"
+                for step in result["routing"]["reasoning_chain"]
+            ))
 
             st.divider()
 
-            # --- Row 2: Response + Details side by side ---
-            col_resp, col_details = st.columns([3, 2])
-
-            with col_resp:
-                st.subheader("Model Response")
-                st.markdown(result["response"]["response_text"])
-
-                # Response metadata
-                resp = result["response"]
-                m1, m2, m3 = st.columns(3)
-                m1.metric("Tokens Used", resp["tokens_used"])
-                m2.metric("Latency", f"{resp['latency_ms']}ms")
-                m3.metric("Cost", f"${resp['simulated_cost']:.6f}")
-
-            with col_details:
-                # Reasoning chain
-                st.subheader("Routing Reasoning")
-                for step in result["routing"]["reasoning_chain"]:
-                    st.markdown(f"**Step {step['step']}:** {step['description']}")
-
-                st.divider()
-
-                # Cost comparison detail
-                st.subheader("Cost Comparison")
-                cc = result["cost_comparison"]
-                cost_df = pd.DataFrame({
-                    "Model": [cc["chosen_model"], cc["baseline_model"]],
-                    "Cost ($)": [cc["chosen_cost"], cc["baseline_cost"]],
-                })
-                fig_cost = px.bar(
-                    cost_df, x="Model", y="Cost ($)",
-                    color="Model",
-                    color_discrete_sequence=["#2ecc71", "#e74c3c"],
-                    title="Cost: Chosen vs Baseline (GPT-4o)",
-                )
-                fig_cost.update_layout(showlegend=False, height=280)
-                st.plotly_chart(fig_cost, use_container_width=True)
-
-                # Classification reasoning
-                st.subheader("Classification Details")
-                st.info(result["classification"]["reasoning"])
-                conf = result["classification"]["confidence"]
-                st.progress(conf, text=f"Confidence: {conf:.0%}")
+            # Cost comparison detail
+            st.subheader("Cost Comparison")
+            cc = result["cost_comparison"]
+            fig_cost = build_cost_chart(
+                cc["chosen_model"], cc["baseline_model"], cc["chosen_cost"], cc["baseline_cost"],
+            )
+            st.plotly_chart(fig_cost, use_container_width=True)
+
+            # Classification reasoning
+            st.subheader("Classification Details")
+            st.markdown(
+                _CONFIDENCE_TPL.format(
+                    reasoning=html.escape(result["classification"]["reasoning"]),
+                    percent=result["classification"]["confidence"] * 100,
+                ),
+                unsafe_allow_html=True,
+            )
 
 
 # ============================= HISTORY TAB ================================
 
-with tab_history:
+def render_history() -> None:
+    """Table of past routing decisions."""
     st.header("Routing History")
 
-    logs = api_call("GET", "/logs?limit=100")
+    logs = _get_logs(100)
 
     if logs is None:
         st.info("Backend not available.")
@@ -275,25 +756,7 @@ with tab_history:
         st.info("No requests logged yet. Use the Router tab to make some requests!")
     else:
         try:
-            df = pd.DataFrame(logs)
-            df = df.rename(columns={
-                "request_id": "Request ID",
-                "timestamp": "Timestamp",
-                "prompt_snippet": "Prompt",
-                "classifier_mode": "Classifier",
-                "complexity_score": "Score",
-                "task_type": "Task Type",
-                "routed_model": "Model",
-                "latency_ms": "Latency (ms)",
-                "cost": "Cost ($)",
-            })
-
-            # Color code by complexity
-            st.dataframe(
-                df[["Timestamp", "Prompt", "Classifier", "Score", "Task Type", "Model", "Latency (ms)", "Cost ($)"]],
-                use_container_width=True,
-                hide_index=True,
-            )
+            st.dataframe(build_logs_table(logs), use_container_width=True, hide_index=True)
         except Exception as e:
             st.error(f"Error displaying logs: {e}")
             traceback.print_exc()
@@ -301,10 +764,11 @@ with tab_history:
 
 # ============================= ANALYTICS TAB ================================
 
-with tab_analytics:
+def render_analytics() -> None:
+    """Cost savings and model distribution charts."""
     st.header("Gateway Analytics")
 
-    stats = api_call("GET", "/stats")
+    stats = _get_stats()
 
     if stats is None:
         st.info("Backend not available.")
@@ -321,87 +785,22 @@ with tab_analytics:
 
             st.divider()
 
-            col_pie, col_bar = st.columns(2)
-
             model_usage = stats["model_usage"]
             if model_usage:
-                usage_df = pd.DataFrame(model_usage)
-
-                # Pie chart — model distribution by request count
-                with col_pie:
-                    st.subheader("Model Distribution")
-                    fig_pie = px.pie(
-                        usage_df,
-                        values="request_count",
-                        names="model",
-                        color_discrete_sequence=px.colors.qualitative.Set2,
-                        hole=0.4,
-                    )
-                    fig_pie.update_layout(height=380)
-                    st.plotly_chart(fig_pie, use_container_width=True)
-
-                # Bar chart — cost per model
-                with col_bar:
-                    st.subheader("Cost by Model")
-                    fig_bar = px.bar(
-                        usage_df,
-                        x="model",
-                        y="total_cost",
-                        color="model",
-                        color_discrete_sequence=px.colors.qualitative.Set2,
-                        labels={"total_cost": "Total Cost ($)", "model": "Model"},
-                    )
-                    fig_bar.update_layout(showlegend=False, height=380)
-                    st.plotly_chart(fig_bar, use_container_width=True)
-
-                st.divider()
-
-                col_lat, col_summary = st.columns(2)
-
-                # Latency comparison
-                with col_lat:
-                    st.subheader("Average Latency by Model")
-                    fig_lat = px.bar(
-                        usage_df,
-                        x="model",
-                        y="avg_latency_ms",
-                        color="model",
-                        color_discrete_sequence=px.colors.qualitative.Pastel,
-                        labels={"avg_latency_ms": "Avg Latency (ms)", "model": "Model"},
-                    )
-                    fig_lat.update_layout(showlegend=False, height=350)
-                    st.plotly_chart(fig_lat, use_container_width=True)
-
-                # Savings gauge
-                with col_summary:
-                    st.subheader("Cost Efficiency")
-                    fig_gauge = go.Figure(go.Indicator(
-                        mode="gauge+number+delta",
-                        value=stats["savings_percent"],
-                        number={"suffix": "%"},
-                        title={"text": "Overall Savings vs GPT-4o Baseline"},
-                        delta={"reference": 50, "increasing": {"color": "#2ecc71"}},
-                        gauge={
-                            "axis": {"range": [0, 100]},
-                            "bar": {"color": "#2ecc71"},
-                            "steps": [
-                                {"range": [0, 30], "color": "#fadbd8"},
-                                {"range": [30, 70], "color": "#fdebd0"},
-                                {"range": [70, 100], "color": "#d5f5e3"},
-                            ],
-                        },
-                    ))
-                    fig_gauge.update_layout(height=350)
-                    st.plotly_chart(fig_gauge, use_container_width=True)
-
-                    st.metric("Avg Prompt Complexity", f"{stats['avg_complexity']}/10")
-
-                    # Baseline vs actual cost comparison
-                    st.markdown(
-                        f"**If all requests used GPT-4o:** ${stats['total_baseline_cost']:.4f}  \n"
-                        f"**Actual cost with routing:** ${stats['total_cost']:.4f}  \n"
-                        f"**You saved:** ${stats['total_savings']:.4f} ({stats['savings_percent']}%)"
-                    )
+                components.html(
+                    build_analytics_html(model_usage, stats["savings_percent"]),
+                    height=_ANALYTICS_HTML_HEIGHT,
+                )
+
+                col_complexity, col_summary = st.columns(2)
+                col_complexity.metric("Avg Prompt Complexity", f"{stats['avg_complexity']}/10")
+
+                # Baseline vs actual cost comparison
+                col_summary.markdown(
+                    f"**If all requests used GPT-4o:** ${stats['total_baseline_cost']:.4f}  \n"
+                    f"**Actual cost with routing:** ${stats['total_cost']:.4f}  \n"
+                    f"**You saved:** ${stats['total_savings']:.4f} ({stats['savings_percent']}%)"
+                )
 
         except Exception as e:
             st.error(f"Error rendering analytics: {e}")
@@ -410,7 +809,8 @@ with tab_analytics:
 
 # ============================= HOW IT WORKS TAB ================================
 
-with tab_how_it_works:
+def render_how_it_works() -> None:
+    """Static explanation of the classify → route → generate pipeline."""
     st.header("How the AI Gateway Works")
 
     st.markdown("""
@@ -424,36 +824,7 @@ with tab_how_it_works:
     # --- Architecture overview ---
     st.subheader("Architecture Overview")
 
-    st.code("""
-    User Prompt
-         │
-         ▼
-    ┌─────────────────┐
-    │   Classifier     │  ← Rule-Based (heuristics) OR LLM-Based (Claude Haiku)
-    │   Output:        │
-    │   - Score (1-10) │
-    │   - Task Type    │
-    │   - Reasoning    │
-    └────────┬────────┘
-             │
-             ▼
-    ┌─────────────────┐
-    │   Router         │  ← Maps (complexity tier + task type) → best model
-    │   Output:        │
-    │   - Model choice │
-    │   - 5-step chain │
-    │   - Cost estimate│
-    └────────┬────────┘
-             │
-             ▼
-    ┌─────────────────┐
-    │   Provider       │  ← Real API call to OpenAI or Anthropic
-    │   Output:        │
-    │   - Response text│
-    │   - Token count  │
-    │   - Actual cost  │
-    └─────────────────┘
-    """, language=None)
+    st.code(_ARCH_DIAGRAM, language=None)
 
     st.divider()
 
@@ -463,11 +834,7 @@ with tab_how_it_works:
     col_rule, col_llm = st.columns(2)
 
     with col_rule:
-        st.markdown("""
-        <div style="padding:20px; border-radius:12px; border:2px solid #3498db; background:#3498db10;">
-        <h3 style="color:#3498db; margin-top:0;">Rule-Based Classifier</h3>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_RULE_CARD_HTML, unsafe_allow_html=True)
 
         st.markdown("#### How it works")
         st.markdown("""
@@ -488,17 +855,7 @@ with tab_how_it_works:
         """)
 
         st.markdown("**Keyword Banks:**")
-        task_examples = {
-            "Code": '`python`, `function`, `debug`, `api`, `build`...',
-            "Math": '`solve`, `integral`, `equation`, `probability`...',
-            "Creative": '`poem`, `story`, `haiku`, `compose`, `fiction`...',
-            "Analysis": '`analyze`, `compare`, `pros and cons`, `evaluate`...',
-            "Translation": '`translate`, `in french`, `in spanish`...',
-            "Reasoning": '`step by step`, `quantum`, `philosophy`, `paradox`...',
-            "Simple QA": '`what is`, `capital of`, `define`, `how many`...',
-        }
-        for task, examples in task_examples.items():
-            st.markdown(f"- **{task}:** {examples}")
+        st.markdown(_TASK_EXAMPLES_MD)
 
         st.markdown("""
         **3. Base Complexity Score**
@@ -509,13 +866,7 @@ with tab_how_it_works:
         **4. Booster & Reducer Adjustments**
         """)
 
-        boost_data = {
-            "Signal": ["'step by step', 'detailed'", "'compare', 'trade-offs'",
-                       "'advanced', 'complex'", "'architecture', 'system design'",
-                       "'simple', 'basic', 'easy'", "'yes or no'", "Very short prompt (<30 chars)"],
-            "Effect": ["+2", "+1", "+2", "+2", "-1", "-2", "-1"],
-        }
-        st.dataframe(pd.DataFrame(boost_data), use_container_width=True, hide_index=True)
+        st.dataframe(_BOOST_DF, use_container_width=True, hide_index=True)
 
         st.markdown("""
         **5. Clamp to [1, 10]**
@@ -537,11 +888,7 @@ with tab_how_it_works:
         """)
 
     with col_llm:
-        st.markdown("""
-        <div style="padding:20px; border-radius:12px; border:2px solid #9b59b6; background:#9b59b610;">
-        <h3 style="color:#9b59b6; margin-top:0;">LLM-Based Classifier</h3>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_LLM_CARD_HTML, unsafe_allow_html=True)
 
         st.markdown("#### How it works")
         st.markdown("""
@@ -578,14 +925,7 @@ with tab_how_it_works:
         """)
 
         st.markdown("**Example LLM Response:**")
-        st.code("""{
-  "complexity_score": 6,
-  "task_type": "code",
-  "reasoning": "This requires writing functional code with error
-    handling, involving HTTP requests, parsing, and exception
-    management. Moderately complex.",
-  "confidence": 0.92
-}""", language="json")
+        st.code(_EXAMPLE_JSON, language="json")
 
         st.markdown("""
         ---
@@ -611,54 +951,14 @@ with tab_how_it_works:
     After classification, the router maps **(complexity tier + task type)** to the optimal model:
     """)
 
-    routing_data = {
-        "Complexity": ["1-3 (Low)", "1-3 (Low)", "4-6 (Medium)", "4-6 (Medium)",
-                       "7-10 (High)", "7-10 (High)"],
-        "Task Types": [
-            "All types",
-            "",
-            "Code, Math, General, Simple QA",
-            "Analysis, Creative, Translation, Reasoning",
-            "Reasoning, Math, Code, Simple QA",
-            "Analysis, Creative, General, Translation",
-        ],
-        "Model": [
-            "GPT-4o-mini", "",
-            "GPT-4o-mini", "Claude 3.5 Sonnet",
-            "GPT-4o", "Claude 3.5 Sonnet",
-        ],
-        "Why": [
-            "Fast and cheapest option for simple tasks",
-            "",
-            "Cost-effective for standard code and math",
-            "Excels at nuanced, creative, and analytical work",
-            "Top-tier reasoning for the hardest problems",
-            "Best at long-form analysis and creative content",
-        ],
-    }
-    # Remove empty rows
-    routing_df = pd.DataFrame(routing_data)
-    routing_df = routing_df[routing_df["Task Types"] != ""]
-    st.dataframe(routing_df, use_container_width=True, hide_index=True)
+    st.dataframe(_ROUTING_DF, use_container_width=True, hide_index=True)
 
     st.divider()
 
     # --- Model comparison ---
     st.subheader("Model Comparison")
 
-    model_data = {
-        "Model": ["GPT-4o-mini", "Claude 3.5 Sonnet", "GPT-4o"],
-        "Provider": ["OpenAI", "Anthropic", "OpenAI"],
-        "Input Cost ($/1k tokens)": ["$0.00015", "$0.003", "$0.005"],
-        "Output Cost ($/1k tokens)": ["$0.0006", "$0.015", "$0.015"],
-        "Avg Latency": ["~300ms", "~700ms", "~800ms"],
-        "Best For": [
-            "Simple QA, translations, basic code",
-            "Analysis, creative writing, nuanced content",
-            "Complex math, advanced reasoning, hard code",
-        ],
-    }
-    st.dataframe(pd.DataFrame(model_data), use_container_width=True, hide_index=True)
+    st.dataframe(_MODEL_DF, use_container_width=True, hide_index=True)
 
     st.markdown("""
     > **Baseline model:** GPT-4o is the most expensive model. All cost savings
@@ -674,11 +974,44 @@ with tab_how_it_works:
     st.markdown("""
     The gateway caches responses to avoid redundant API calls:
 
-    - **Key:** SHA-256 hash of `(prompt text + classifier mode)`
+    - **Key:** `(prompt text, classifier mode)` tuple — prompt stripped and lowercased
     - **LRU Eviction:** Max 100 entries — least recently used entry is evicted when full
     - **TTL Expiry:** Entries automatically expire after 30 minutes
-    - **Thread-Safe:** All operations are locked for concurrent request safety
+    - **Thread-Safe:** Lookups are lock-free; hits are re-checked and all writes happen under a lock
 
     When a cached response is found, it's returned **instantly** (typically <10ms)
     with zero API cost. Cache stats are visible in the sidebar.
     """)
+
+
+# ============================= TAB SELECTOR ================================
+
+TABS = ("Router", "History", "Analytics", "How It Works")
+
+_TAB_RENDERERS = {
+    "Router": render_router,
+    "History": render_history,
+    "Analytics": render_analytics,
+    "How It Works": render_how_it_works,
+}
+
+
+def _sync_tab_query_param() -> None:
+    """Mirror the selected tab into ?tab= so views can be deep-linked."""
+    st.query_params["tab"] = st.session_state["active_tab"]
+
+
+if "active_tab" not in st.session_state:
+    requested_tab = st.query_params.get("tab")
+    st.session_state["active_tab"] = requested_tab if requested_tab in TABS else TABS[0]
+
+active_tab = st.radio(
+    "View",
+    TABS,
+    key="active_tab",
+    horizontal=True,
+    label_visibility="collapsed",
+    on_change=_sync_tab_query_param,
+)
+
+_TAB_RENDERERS[active_tab]()